@@ -5,12 +5,12 @@ This module provides decorators similar to Hypothesis for more ergonomic
 property-based testing with complex functions.
 """
 
+import functools
 import inspect
-import itertools
 from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from .generator import Generator
-from .property import Property, PropertyTestError
+from .property import Property, PropertyTestError, _matrix_case_args
 
 
 def for_all(
@@ -120,6 +120,20 @@ def for_all(
                 f"but {len(generators)} generators were provided"
             )
 
+        def make_property(
+            property_func: Callable[..., bool],
+            config_num_runs: int,
+            config_seed: Union[str, int, None],
+        ) -> Property:
+            return Property(
+                property_func,
+                num_runs=config_num_runs,
+                seed=config_seed,
+                examples=existing_examples,  # Examples shared across all configs
+                original_func=func,
+                signature=sig,  # Resolved once at decoration time
+            )
+
         # Don't use @functools.wraps to avoid pytest fixture injection issues
         def wrapper(*args, **kwargs):
             # For test class methods (both unittest and pytest), we need to handle
@@ -176,24 +190,14 @@ def for_all(
                         config_num_runs = config.get("num_runs", override_num_runs)
                         config_seed = config.get("seed", override_seed)
 
-                        property_test = Property(
-                            test_property,
-                            num_runs=config_num_runs,
-                            seed=config_seed,
-                            examples=existing_examples,  # Examples shared across all configs # noqa: E501
-                            original_func=func,  # Pass original function for signature
-                        )
-                        property_test.for_all(*config_generators)
+                        make_property(
+                            test_property, config_num_runs, config_seed
+                        ).for_all(*config_generators)
 
                     # Run the current @for_all configuration
-                    property_test = Property(
-                        test_property,
-                        num_runs=override_num_runs,
-                        seed=override_seed,
-                        examples=existing_examples,
-                        original_func=func,  # Pass original function for signature
-                    )
-                    property_test.for_all(*generators)
+                    make_property(
+                        test_property, override_num_runs, override_seed
+                    ).for_all(*generators)
                     return None  # Test frameworks expect test functions to return
                     # None
                 except PropertyTestError as e:
@@ -250,24 +254,14 @@ def for_all(
                         config_num_runs = config.get("num_runs", override_num_runs)
                         config_seed = config.get("seed", override_seed)
 
-                        property_test = Property(
-                            assertion_property,
-                            num_runs=config_num_runs,
-                            seed=config_seed,
-                            examples=existing_examples,  # Examples shared across all configs # noqa: E501
-                            original_func=func,  # Pass original function for signature
-                        )
-                        property_test.for_all(*config_generators)
+                        make_property(
+                            assertion_property, config_num_runs, config_seed
+                        ).for_all(*config_generators)
 
                     # Run the current @for_all configuration
-                    property_test = Property(
-                        assertion_property,
-                        num_runs=override_num_runs,
-                        seed=override_seed,
-                        examples=existing_examples,
-                        original_func=func,  # Pass original function for signature
-                    )
-                    property_test.for_all(*generators)
+                    make_property(
+                        assertion_property, override_num_runs, override_seed
+                    ).for_all(*generators)
                     return None  # Pytest expects test functions to return None
                 except PropertyTestError as e:
                     # Re-raise as AssertionError for better test framework integration
@@ -330,8 +324,6 @@ def _create_standalone_wrapper(func: Callable, original_func: Callable) -> Calla
     Returns:
         A wrapped function that can execute standalone test cases
     """
-    import functools
-
     sig = inspect.signature(original_func)
     params = [
         p.name for p in sig.parameters.values() if p.kind == p.POSITIONAL_OR_KEYWORD
@@ -496,8 +488,11 @@ def matrix(**kwargs: Iterable[Any]):
         # Store matrix specs as a list (each decorator adds its own spec)
         if not hasattr(func, "_proptest_matrices"):
             func._proptest_matrices = []  # type: ignore
-        # Append this matrix spec to the list
-        func._proptest_matrices.append(dict(kwargs))  # type: ignore
+        # Append this matrix spec to the list, materializing the values once so
+        # one-shot iterables still produce every case on repeated runs
+        func._proptest_matrices.append(  # type: ignore
+            {name: list(values) for name, values in kwargs.items()}
+        )
 
         # Check if already wrapped (to avoid double-wrapping)
         if hasattr(func, "_proptest_standalone_wrapper"):
@@ -513,31 +508,9 @@ def matrix(**kwargs: Iterable[Any]):
 def _run_matrix_cases(
     func: Callable, self_obj: Any, matrix_spec: Dict[str, Iterable[Any]]
 ):
-    # Build argument order from function signature (skip self when present)
-    sig = inspect.signature(func)
-    params: List[str] = [
-        p.name for p in sig.parameters.values() if p.kind == p.POSITIONAL_OR_KEYWORD
-    ]
-    is_method = bool(params and params[0] == "self")
-    call_params = params[1:] if is_method else params
-
-    # Only run matrix cases if all call parameters are covered by matrix spec
-    if not all(name in matrix_spec for name in call_params):
-        return
-
-    # Only include parameters that are actually needed by the function
-    needed_keys = [k for k in matrix_spec.keys() if k in call_params]
-    if not needed_keys:
-        return
-
-    # Construct cartesian product in key order
-    values_product = itertools.product(*[list(matrix_spec[k]) for k in needed_keys])
+    is_method, cases = _matrix_case_args(func, matrix_spec)
 
-    for combo in values_product:
-        # Map provided keys to their values
-        arg_map: Dict[str, Any] = dict(zip(needed_keys, combo))
-        # Build positional args in function param order
-        args_in_order: List[Any] = [arg_map[name] for name in call_params]
+    for args_in_order in cases:
         try:
             if is_method:
                 func(self_obj, *args_in_order)
@@ -1,7 +1,7 @@
 """Generator for dictionary types using pair shrinking and membership-wise
 and element-wise strategies aligned with cppproptest's map shrinking."""
 
-from typing import Dict, List, TypeVar
+from typing import Dict, List, Optional, TypeVar
 
 from ..shrinker import Shrinkable
 from .base import Generator, Random
@@ -38,46 +38,64 @@ class DictGenerator(Generator[Dict[T, U]]):
         for _ in range(size):
             key_shrinkables.append(self.key_generator.generate(rng))
             value_shrinkables.append(self.value_generator.generate(rng))
-        # Manual shrinking (membership + value shrinking) with duplicate filtering.
-        # Pair/key shrinking deferred to future when tests permit non-unique paths.
         value = {k.value: v.value for k, v in zip(key_shrinkables, value_shrinkables)}
-        shrinks: List[Shrinkable[Dict[T, U]]] = []
-        seen = set()
-
-        def make_hashable(x):  # recursive helper
-            if isinstance(x, dict):
-                return tuple(sorted((k, make_hashable(v)) for k, v in x.items()))
-            if isinstance(x, list):
-                return tuple(make_hashable(v) for v in x)
-            if isinstance(x, set):
-                return tuple(sorted(make_hashable(v) for v in x))
-            return x
-
-        def add_candidate(d: Dict[T, U]):
-            key = make_hashable(d)
-            if key in seen:
-                return
-            seen.add(key)
-            shrinks.append(Shrinkable(dict(d)))
-
-        # Empty dict
-        if len(value) > 0:
-            add_candidate({})
-
-        items = list(value.items())
-        # Remove last / first
-        if len(items) > 1:
-            add_candidate(dict(items[:-1]))
-            add_candidate(dict(items[1:]))
-
-        # Shrunk values (keys fixed)
-        for i, (k_val, v_val) in enumerate(items):
-            original_shr = value_shrinkables[i]
-            for shrunk_v in original_shr.shrinks().to_list():
-                new_items = items.copy()
-                new_items[i] = (k_val, shrunk_v.value)
-                add_candidate(dict(new_items))
 
         from ..stream import Stream
 
-        return Shrinkable(value, lambda: Stream.many(shrinks))
+        # Candidates are only needed once a property fails, so build them on
+        # first use and reuse them afterwards
+        shrinks: Optional[List[Shrinkable[Dict[T, U]]]] = None
+
+        def make_shrinks():
+            nonlocal shrinks
+            if shrinks is None:
+                shrinks = _dict_shrinks(value, value_shrinkables)
+            return Stream.many(shrinks)
+
+        return Shrinkable(value, make_shrinks)
+
+
+def _dict_shrinks(
+    value: Dict[T, U], value_shrinkables: List[Shrinkable[U]]
+) -> List[Shrinkable[Dict[T, U]]]:
+    """Build the first level of shrinks for a generated dictionary."""
+    # Manual shrinking (membership + value shrinking) with duplicate filtering.
+    # Pair/key shrinking deferred to future when tests permit non-unique paths.
+    shrinks: List[Shrinkable[Dict[T, U]]] = []
+    seen = set()
+
+    def make_hashable(x):  # recursive helper
+        if isinstance(x, dict):
+            return tuple(sorted((k, make_hashable(v)) for k, v in x.items()))
+        if isinstance(x, list):
+            return tuple(make_hashable(v) for v in x)
+        if isinstance(x, set):
+            return tuple(sorted(make_hashable(v) for v in x))
+        return x
+
+    def add_candidate(d: Dict[T, U]):
+        key = make_hashable(d)
+        if key in seen:
+            return
+        seen.add(key)
+        shrinks.append(Shrinkable(dict(d)))
+
+    # Empty dict
+    if len(value) > 0:
+        add_candidate({})
+
+    items = list(value.items())
+    # Remove last / first
+    if len(items) > 1:
+        add_candidate(dict(items[:-1]))
+        add_candidate(dict(items[1:]))
+
+    # Shrunk values (keys fixed)
+    for i, (k_val, v_val) in enumerate(items):
+        original_shr = value_shrinkables[i]
+        for shrunk_v in original_shr.shrinks().to_list():
+            new_items = items.copy()
+            new_items[i] = (k_val, shrunk_v.value)
+            add_candidate(dict(new_items))
+
+    return shrinks
@@ -6,12 +6,16 @@ for running property-based tests.
 """
 
 import inspect
+import itertools
+import operator
 import random
+import weakref
 from typing import (
     Any,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -62,6 +66,7 @@ class Property:
             List[Union[Tuple[Any, ...], Tuple[Tuple[Any, ...], Dict[str, Any]]]]
         ] = None,
         original_func: Optional[Callable[..., Any]] = None,
+        signature: Optional[inspect.Signature] = None,
     ):
         self.property_func = property_func
         self.num_runs = num_runs
@@ -69,9 +74,12 @@ class Property:
         self.examples = examples or []
         self._rng = self._create_rng()
         # Cache function signature for example resolution
-        # Use original_func for signature if provided (for wrapped functions)
-        sig_func = original_func if original_func is not None else property_func
-        self._func_sig = inspect.signature(sig_func)
+        # Use a precomputed signature, else original_func if provided (for
+        # wrapped functions)
+        if signature is None:
+            sig_func = original_func if original_func is not None else property_func
+            signature = inspect.signature(sig_func)
+        self._func_sig = signature
         self._param_names = [
             p.name
             for p in self._func_sig.parameters.values()
@@ -182,43 +190,23 @@ class Property:
             raise ValueError("At least one generator must be provided")
 
         # Test examples first
-        for example_data in self.examples:
-            # Resolve example to positional arguments
-            example_inputs = self._resolve_example(example_data, len(generators))
-            if example_inputs is None:
-                continue  # Skip examples with wrong number of arguments
-
-            try:
-                result = self.property_func(*example_inputs)
-                if not result:
-                    # Example failed, create error
-                    raise PropertyTestError(
-                        f"Property failed on example: {example_inputs}",
-                        failing_inputs=list(example_inputs),
-                        minimal_inputs=list(example_inputs),
-                    )
-            except Exception as e:
-                if "Assumption failed" in str(e):
-                    continue  # Skip examples that fail assumptions
-                raise PropertyTestError(
-                    f"Property failed on example: {example_inputs}",
-                    failing_inputs=list(example_inputs),
-                    minimal_inputs=list(example_inputs),
-                ) from e
+        if self.examples:
+            self._run_examples(len(generators))
 
         # Then run random tests
+        rng = self._rng
+        save_rng_state = rng.getstate
+        property_func = self.property_func
         for run in range(self.num_runs):
-            saved_rng_state = self._rng.getstate()  # type: ignore[attr-defined]
+            saved_rng_state = save_rng_state()
+            inputs: List[Any] = []
             try:
                 # Generate test inputs
-                inputs = []
                 for generator in generators:
-                    shrinkable = generator.generate(self._rng)
-                    input_val = shrinkable.value
-                    inputs.append(input_val)
+                    inputs.append(generator.generate(rng).value)
 
                 # Run the property
-                result = self.property_func(*inputs)
+                result = property_func(*inputs)
 
                 if not result:
                     # Property failed, try to shrink
@@ -230,10 +218,9 @@ class Property:
                         failing_inputs=inputs,
                         minimal_inputs=minimal_inputs,
                     )
-
+            except PropertyTestError:
+                raise
             except Exception as e:
-                if isinstance(e, PropertyTestError):
-                    raise
                 # Other exceptions are treated as property failures
                 minimal_inputs = self._shrink_failing_inputs(
                     inputs, list(generators), saved_rng_state
@@ -246,6 +233,37 @@ class Property:
 
         return True
 
+    def _run_examples(self, arg_count: int) -> None:
+        """Run the explicit examples against the property function.
+
+        Raises:
+            PropertyTestError: If an example fails
+        """
+        property_func = self.property_func
+        for example_data in self.examples:
+            # Resolve example to positional arguments
+            example_inputs = self._resolve_example(example_data, arg_count)
+            if example_inputs is None:
+                continue  # Skip examples with wrong number of arguments
+
+            try:
+                result = property_func(*example_inputs)
+                if not result:
+                    # Example failed, create error
+                    raise PropertyTestError(
+                        f"Property failed on example: {example_inputs}",
+                        failing_inputs=list(example_inputs),
+                        minimal_inputs=list(example_inputs),
+                    )
+            except Exception as e:
+                if "Assumption failed" in str(e):
+                    continue  # Skip examples that fail assumptions
+                raise PropertyTestError(
+                    f"Property failed on example: {example_inputs}",
+                    failing_inputs=list(example_inputs),
+                    minimal_inputs=list(example_inputs),
+                ) from e
+
     def _shrink_failing_inputs(
         self,
         inputs: List[Any],
@@ -704,43 +722,85 @@ def run_for_all(
         return property_test.for_all(*generators)
 
 
-def run_matrix(
-    test_func: Callable[..., Any],
-    matrix_spec: Dict[str, Iterable[Any]],
-    *,
-    self_obj: Optional[Any] = None,
-) -> None:
-    """
-    Execute an exhaustive matrix (Cartesian product) of inputs for a test function.
+# Parsed matrix parameters per function; weak keys let test functions be freed
+_MATRIX_CALL_PARAMS: (
+    "weakref.WeakKeyDictionary[Callable, Tuple[bool, Tuple[str, ...]]]"
+) = weakref.WeakKeyDictionary()
 
-    Matrix cases are executed once each, without shrinking and without counting
-    toward property num_runs.
-    """
-    # Resolve parameter order
-    import inspect
-    import itertools
 
-    sig = inspect.signature(test_func)
-    params: List[str] = [
+def _matrix_call_params(func: Callable) -> Tuple[bool, Tuple[str, ...]]:
+    """Return whether func takes 'self' and the names of its other parameters."""
+    try:
+        return _MATRIX_CALL_PARAMS[func]
+    except (KeyError, TypeError):
+        pass  # Not seen yet, or unhashable / not weakly referenceable
+
+    # Build argument order from function signature (skip self when present)
+    sig = inspect.signature(func)
+    params = tuple(
         p.name for p in sig.parameters.values() if p.kind == p.POSITIONAL_OR_KEYWORD
-    ]
+    )
     is_method = bool(params and params[0] == "self")
-    call_params = params[1:] if is_method else params
+    call_params = (is_method, params[1:] if is_method else params)
+
+    try:
+        _MATRIX_CALL_PARAMS[func] = call_params
+    except TypeError:
+        pass  # Such callables are parsed again on every run
+    return call_params
+
+
+def _matrix_case_args(
+    func: Callable, matrix_spec: Dict[str, Iterable[Any]]
+) -> Tuple[bool, Iterator[Tuple[Any, ...]]]:
+    """
+    Expand a matrix spec into positional argument tuples for func.
+
+    Returns:
+        Whether func takes 'self', and an iterator over the argument tuples (without
+        self) in Cartesian product order. The iterator is empty when the spec does
+        not cover every parameter of func.
+    """
+    is_method, call_params = _matrix_call_params(func)
 
     # Only run matrix cases if all call parameters are covered by matrix spec
     if not all(name in matrix_spec for name in call_params):
-        return
+        return is_method, iter(())
 
     # Only include parameters that are actually needed by the function
     needed_keys = [k for k in matrix_spec.keys() if k in call_params]
     if not needed_keys:
-        return
+        return is_method, iter(())
+
+    # Construct cartesian product in key order
+    values_product = itertools.product(*[matrix_spec[k] for k in needed_keys])
+
+    # Position of each function parameter within a product combination
+    positions = [needed_keys.index(name) for name in call_params]
+    if positions == sorted(positions):
+        # Spec keys already follow the function's parameter order
+        return is_method, values_product
+
+    # Build positional args in function param order; with two or more
+    # positions itemgetter returns a tuple
+    return is_method, map(operator.itemgetter(*positions), values_product)
+
+
+def run_matrix(
+    test_func: Callable[..., Any],
+    matrix_spec: Dict[str, Iterable[Any]],
+    *,
+    self_obj: Optional[Any] = None,
+) -> None:
+    """
+    Execute an exhaustive matrix (Cartesian product) of inputs for a test function.
 
-    values_product = itertools.product(*[list(matrix_spec[k]) for k in needed_keys])
+    Matrix cases are executed once each, without shrinking and without counting
+    toward property num_runs.
+    """
+    is_method, cases = _matrix_case_args(test_func, matrix_spec)
 
-    for combo in values_product:
-        arg_map: Dict[str, Any] = dict(zip(needed_keys, combo))
-        args_in_order: List[Any] = [arg_map[name] for name in call_params]
+    for args_in_order in cases:
         if is_method or self_obj is not None:
             target = self_obj
             if target is None:
@@ -6,7 +6,7 @@ Matches cppproptest's shrinkIntegral implementation.
 
 import math
 import sys
-from typing import List
+from typing import List, Optional
 
 from ..stream import Stream
 from . import Shrinkable
@@ -241,6 +241,37 @@ def _binary_search_towards_max(
         return shrinks
 
 
+def _integral_shrinks(
+    value: int, min_value: int, max_value: int
+) -> List[Shrinkable[int]]:
+    """Build the first level of shrinks for an integer in [min_value, max_value]."""
+    # Use binary search approach similar to cppproptest
+    if min_value >= 0:
+        # Range is entirely non-negative: shrink towards min_value
+        if value == min_value:
+            return []  # Already at minimum, can't shrink further
+        return _binary_search_towards_min(
+            value - min_value, min_value, min_value, max_value
+        )
+    elif max_value <= 0:
+        # Range is entirely non-positive: shrink towards max_value
+        if value == max_value:
+            return []  # Already at maximum (least negative), can't shrink further
+        return _binary_search_towards_max(
+            value - max_value, max_value, min_value, max_value
+        )
+    else:
+        # Range crosses zero: shrink towards 0
+        # For negative numbers, smaller negatives are more complex, so we should
+        # shrink towards 0 even if at min_value boundary
+        # For positive numbers, larger positives are more complex, so we should
+        # shrink towards 0 even if at max_value boundary
+        # Only 0 itself cannot shrink further
+        if value == 0:
+            return []  # Already at 0, can't shrink further
+        return _binary_search_towards_zero(value, min_value, max_value)
+
+
 def shrink_integral(
     value: int,
     min_value: int = -sys.maxsize - 1,
@@ -257,36 +288,13 @@ def shrink_integral(
     Returns:
         A Shrinkable containing the value and its shrinks
     """
-    # Use binary search approach similar to cppproptest
-    if min_value >= 0:
-        # Range is entirely non-negative: shrink towards min_value
-        if value == min_value:
-            shrinks = []  # Already at minimum, can't shrink further
-        else:
-            shrinks = _binary_search_towards_min(
-                value - min_value, min_value, min_value, max_value
-            )
-    elif max_value <= 0:
-        # Range is entirely non-positive: shrink towards max_value
-        if value == max_value:
-            shrinks = []  # Already at maximum (least negative), can't shrink further
-        else:
-            shrinks = _binary_search_towards_max(
-                value - max_value, max_value, min_value, max_value
-            )
-    else:
-        # Range crosses zero: shrink towards 0
-        # For negative numbers, smaller negatives are more complex, so we should
-        # shrink towards 0 even if at min_value boundary
-        # For positive numbers, larger positives are more complex, so we should
-        # shrink towards 0 even if at max_value boundary
-        # Only 0 itself cannot shrink further
-        if value == 0:
-            shrinks = []  # Already at 0, can't shrink further
-        else:
-            shrinks = _binary_search_towards_zero(value, min_value, max_value)
+    # Shrinks are only needed once a property fails, so build them on first use
+    shrinks: Optional[List[Shrinkable[int]]] = None
 
     def make_shrinks():
+        nonlocal shrinks
+        if shrinks is None:
+            shrinks = _integral_shrinks(value, min_value, max_value)
         return Stream.many(shrinks) if shrinks else Stream.empty()
 
     return Shrinkable(value, make_shrinks)
@@ -297,7 +305,12 @@ def binary_search_shrinkable(value: int) -> Shrinkable[int]:
     Create a shrinkable for an integer using binary search towards 0.
     This is the core function used when the range crosses zero.
     """
-    shrinks = _binary_search_towards_zero(value)
-    return Shrinkable(
-        value, lambda: Stream.many(shrinks) if shrinks else Stream.empty()
-    )
+    shrinks: Optional[List[Shrinkable[int]]] = None
+
+    def make_shrinks():
+        nonlocal shrinks
+        if shrinks is None:
+            shrinks = _binary_search_towards_zero(value)
+        return Stream.many(shrinks) if shrinks else Stream.empty()
+
+    return Shrinkable(value, make_shrinks)
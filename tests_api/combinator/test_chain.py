@@ -4,19 +4,44 @@ import unittest
 
 from python_proptest import Gen, PropertyTestError, for_all, run_for_all
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Generators referenced from chain lambdas, built once instead of per draw
+_ELEM_0_100 = Gen.int(0, 100)
+_INT_0_1 = Gen.int(0, 1)
+_INT_10_20 = Gen.int(10, 20)
+_INT_1_5 = Gen.int(1, 5)
+_INT_1_10 = Gen.int(1, 10)
+
+# Allowed dependent values for each branch of the bool -> int chain
+_TRUE_VALUES = frozenset((0, 1))
+_FALSE_RANGE = range(10, 21)
+
+
+@for_all(Gen.chain(_INT_1_10, lambda value: Gen.int(value * 2, value * 3)))
+def _multiplication_dependency(self, pair):
+    """Decorated once at import; invoked with the running test case."""
+    x, y = pair
+    self.assertGreaterEqual(y, x * 2)
+    self.assertLessEqual(y, x * 3)
+
 
 class TestChainCombinator(unittest.TestCase):
     """Validate chain combinator across declarative and fluent APIs."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.string_gen = Gen.chain(
+            Gen.int(3, 10),
+            lambda length: Gen.str(min_length=length, max_length=length),
+        )
+
     def test_simple_chain_static_api_function_style(self):
         """run_for_all handles chain defined via static API helper."""
 
-        def days_in_month(month: int) -> int:
-            return [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month - 1]
-
         date_gen = Gen.chain(
             Gen.int(1, 12),
-            lambda month: Gen.int(1, days_in_month(month)),
+            lambda month: Gen.int(1, _DAYS_IN_MONTH[month - 1]),
         )
 
         @run_for_all(date_gen, num_runs=20)
@@ -27,14 +52,12 @@ class TestChainCombinator(unittest.TestCase):
             self.assertGreaterEqual(month, 1)
             self.assertLessEqual(month, 12)
             self.assertGreaterEqual(day, 1)
-            self.assertLessEqual(day, days_in_month(month))
+            self.assertLessEqual(day, _DAYS_IN_MONTH[month - 1])
 
     @for_all(
         Gen.chain(
             Gen.int(1, 12),
-            lambda month: Gen.int(
-                1, [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month - 1]
-            ),
+            lambda month: Gen.int(1, _DAYS_IN_MONTH[month - 1]),
         ),
         num_runs=20,
     )
@@ -46,14 +69,13 @@ class TestChainCombinator(unittest.TestCase):
         month, day = date_tuple
         self.assertGreaterEqual(month, 1)
         self.assertLessEqual(month, 12)
-        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
         self.assertGreaterEqual(day, 1)
-        self.assertLessEqual(day, days_in_month[month - 1])
+        self.assertLessEqual(day, _DAYS_IN_MONTH[month - 1])
 
     def test_fluent_chain_api(self):
         """Fluent ``Gen.chain`` maintains dependency ordering."""
 
-        chained_gen = Gen.int(1, 10).chain(lambda x: Gen.int(x, x + 10))
+        chained_gen = _INT_1_10.chain(lambda x: Gen.int(x, x + 10))
 
         @run_for_all(chained_gen, num_runs=15)
         def check_chain_dependency(pair):
@@ -68,7 +90,7 @@ class TestChainCombinator(unittest.TestCase):
         """Nested chaining builds larger tuples while preserving constraints."""
 
         triple_gen = Gen.chain(
-            Gen.chain(Gen.int(1, 5), lambda width: Gen.int(width, width + 5)),
+            Gen.chain(_INT_1_5, lambda width: Gen.int(width, width + 5)),
             lambda width_height: Gen.int(1, width_height[0] * width_height[1]),
         )
 
@@ -85,12 +107,7 @@ class TestChainCombinator(unittest.TestCase):
     def test_chain_with_other_generators(self):
         """Chaining across heterogeneous generator types stays consistent."""
 
-        string_gen = Gen.chain(
-            Gen.int(3, 10),
-            lambda length: Gen.str(min_length=length, max_length=length),
-        )
-
-        @run_for_all(string_gen, num_runs=10)
+        @run_for_all(self.string_gen, num_runs=10)
         def check_string_length(pair):
             length, string_value = pair
             self.assertEqual(len(string_value), length)
@@ -102,7 +119,7 @@ class TestChainCombinator(unittest.TestCase):
 
         list_gen = Gen.chain(
             Gen.int(2, 5),
-            lambda size: Gen.list(Gen.int(0, 100), min_length=size, max_length=size),
+            lambda size: Gen.list(_ELEM_0_100, min_length=size, max_length=size),
         )
 
         @run_for_all(list_gen, num_runs=10)
@@ -118,11 +135,8 @@ class TestChainCombinator(unittest.TestCase):
     def test_shrinking_maintains_dependencies(self):
         """Shrinking candidates stay within derived bounds."""
 
-        def days_in_month(month: int) -> int:
-            return [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month - 1]
-
         date_gen = Gen.chain(
-            Gen.int(1, 12), lambda month: Gen.int(1, days_in_month(month))
+            Gen.int(1, 12), lambda month: Gen.int(1, _DAYS_IN_MONTH[month - 1])
         )
 
         with self.assertRaises(PropertyTestError) as ctx:
@@ -135,7 +149,7 @@ class TestChainCombinator(unittest.TestCase):
         self.assertGreaterEqual(minimal_month, 1)
         self.assertLessEqual(minimal_month, 12)
         self.assertGreaterEqual(minimal_day, 1)
-        self.assertLessEqual(minimal_day, days_in_month(minimal_month))
+        self.assertLessEqual(minimal_day, _DAYS_IN_MONTH[minimal_month - 1])
 
     def test_chain_preserves_single_value_generators(self):
         """Chaining from ``Gen.just`` keeps the anchor value intact."""
@@ -151,7 +165,7 @@ class TestChainCombinator(unittest.TestCase):
     def test_nested_tuple_chaining(self):
         """Chaining on tuple outputs appends trailing dependent value."""
 
-        base_tuple_gen = Gen.tuple(Gen.int(1, 5), Gen.int(1, 5))
+        base_tuple_gen = Gen.tuple(_INT_1_5, _INT_1_5)
         extended_gen = Gen.chain(
             base_tuple_gen,
             lambda pair: Gen.int(pair[0] + pair[1], pair[0] + pair[1] + 10),
@@ -181,13 +195,7 @@ class TestChainCombinator(unittest.TestCase):
     def test_chain_with_for_all_decorator(self):
         """@for_all decorated helper executes immediately when invoked."""
 
-        @for_all(Gen.chain(Gen.int(1, 10), lambda value: Gen.int(value * 2, value * 3)))
-        def property_under_test(self, pair):
-            x, y = pair
-            self.assertGreaterEqual(y, x * 2)
-            self.assertLessEqual(y, x * 3)
-
-        property_under_test(self)
+        _multiplication_dependency(self)
 
     def test_error_handling(self):
         """Invalid dependent ranges should raise during generation."""
@@ -207,18 +215,16 @@ class TestChainCombinator(unittest.TestCase):
 
         mixed_chain = Gen.chain(
             Gen.bool(),
-            lambda predicate: Gen.int(0, 1) if predicate else Gen.int(10, 20),
+            lambda predicate: _INT_0_1 if predicate else _INT_10_20,
         )
 
         def property_under_test(value):
             boolean, integer = value
-            if not isinstance(boolean, bool):
-                return False
-            if not isinstance(integer, int):
-                return False
-            if boolean:
-                return integer in (0, 1)
-            return 10 <= integer <= 20
+            return (
+                type(boolean) is bool
+                and type(integer) is int
+                and integer in (_TRUE_VALUES if boolean else _FALSE_RANGE)
+            )
 
         run_for_all(property_under_test, mixed_chain, num_runs=60)
 
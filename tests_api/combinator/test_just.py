@@ -27,13 +27,18 @@ class TestJust(unittest.TestCase):
             {"key": "value"},
         ]
 
-        for value in test_cases:
-            generator = Gen.just(value)
+        generators = [(value, Gen.just(value)) for value in test_cases]
+
+        for value, generator in generators:
+            expected_type = type(value)
 
             def property_under_test(sample):
-                return sample == value and type(sample) is type(value)
+                return sample is value or (
+                    sample == value and type(sample) is expected_type
+                )
 
-            run_for_all(property_under_test, generator, num_runs=20)
+            with self.subTest(value=value):
+                run_for_all(property_under_test, generator, num_runs=20)
 
 
 if __name__ == "__main__":
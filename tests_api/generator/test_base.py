@@ -4,63 +4,56 @@ import unittest
 
 from python_proptest import Gen, for_all
 
+_INT_0_5 = Gen.int(0, 5)
+_BOOL = Gen.bool()
+_STR_1_3 = Gen.str(min_length=1, max_length=3)
+_GEN_TUPLE = Gen.tuple(_INT_0_5, _BOOL, _STR_1_3)
+_GEN_DICT = Gen.dict(
+    Gen.str(min_length=1, max_length=2),
+    Gen.int(min_value=0, max_value=5),
+    min_size=0,
+    max_size=3,
+)
+_GEN_SET = Gen.set(Gen.int(min_value=0, max_value=10), min_size=0, max_size=5)
+
 
 class TestGeneratorBase(unittest.TestCase):
     """Validate tuple and dict/set generators provided by ``Gen`` namespace."""
 
-    @for_all(
-        Gen.tuple(Gen.int(0, 5), Gen.bool(), Gen.str(min_length=1, max_length=3)),
-        num_runs=200,
-    )
+    @for_all(Gen.tuple(_GEN_TUPLE, _GEN_DICT, _GEN_SET), num_runs=1)
+    def test_types_smoke(self, values):
+        """Tuple, dict and set generators yield their container types."""
+
+        self.assertEqual(tuple(map(type, values)), (tuple, dict, set))
+
+    @for_all(_GEN_TUPLE, num_runs=200)
     def test_tuple_generator_preserves_order(self, value):
         """Tuple generator combines elements in declared order."""
 
-        self.assertIsInstance(value, tuple)
-        self.assertEqual(len(value), 3)
         first, second, third = value
-        self.assertIsInstance(first, int)
-        self.assertGreaterEqual(first, 0)
-        self.assertLessEqual(first, 5)
-        self.assertIsInstance(second, bool)
-        self.assertIsInstance(third, str)
-        self.assertGreaterEqual(len(third), 1)
-        self.assertLessEqual(len(third), 3)
-
-    @for_all(
-        Gen.dict(
-            Gen.str(min_length=1, max_length=2),
-            Gen.int(min_value=0, max_value=5),
-            min_size=0,
-            max_size=3,
-        ),
-        num_runs=200,
-    )
+        self.assertTrue(
+            isinstance(first, int)
+            and 0 <= first <= 5
+            and isinstance(second, bool)
+            and isinstance(third, str)
+            and 1 <= len(third) <= 3,
+            value,
+        )
+
+    @for_all(_GEN_DICT, num_runs=200)
     def test_dict_generator_constraints(self, value):
         """Dictionary generator adheres to size and value constraints."""
 
-        self.assertIsInstance(value, dict)
-        self.assertLessEqual(len(value), 3)
+        self.assertTrue(len(value) <= 3, value)
         for key, val in value.items():
-            self.assertIsInstance(key, str)
-            self.assertGreaterEqual(len(key), 1)
-            self.assertLessEqual(len(key), 2)
-            self.assertIsInstance(val, int)
-            self.assertGreaterEqual(val, 0)
-            self.assertLessEqual(val, 5)
+            self.assertTrue(isinstance(key, str) and 1 <= len(key) <= 2, key)
+            self.assertTrue(isinstance(val, int) and 0 <= val <= 5, val)
 
-    @for_all(
-        Gen.set(
-            Gen.int(min_value=0, max_value=10),
-            min_size=0,
-            max_size=5,
-        ),
-        num_runs=200,
-    )
+    @for_all(_GEN_SET, num_runs=200)
     def test_set_generator_uniqueness(self, value):
         """Set generator returns unique elements within range."""
 
-        self.assertIsInstance(value, set)
-        self.assertTrue(all(0 <= elem <= 10 for elem in value))
+        self.assertTrue(not value or (min(value) >= 0 and max(value) <= 10), value)
 
 
 if __name__ == "__main__":
@@ -4,23 +4,33 @@ import unittest
 
 from python_proptest import Gen, for_all
 
+_BOOL = Gen.bool()
+_ALWAYS_TRUE = Gen.bool(true_prob=1.0)
+_ALWAYS_FALSE = Gen.bool(true_prob=0.0)
+
 
 class TestBoolGenerator(unittest.TestCase):
     """Ensure boolean generator honours its probability contract."""
 
-    @for_all(Gen.bool(), num_runs=200)
+    @for_all(Gen.tuple(_BOOL, _ALWAYS_TRUE, _ALWAYS_FALSE), num_runs=1)
+    def test_types_smoke(self, values):
+        """Every boolean generator yields ``bool`` instances."""
+
+        self.assertEqual(tuple(map(type, values)), (bool, bool, bool))
+
+    @for_all(_BOOL, num_runs=200)
     def test_bool_outputs_are_boolean(self, value):
-        """Generated values should always be ``bool`` instances."""
+        """Generated values are always ``True`` or ``False``."""
 
-        self.assertIsInstance(value, bool)
+        self.assertTrue(value is True or value is False, value)
 
-    @for_all(Gen.bool(true_prob=1.0), num_runs=50)
+    @for_all(_ALWAYS_TRUE, num_runs=50)
     def test_true_probability_one(self, value):
         """Probability of 1.0 yields only ``True`` values."""
 
         self.assertIs(value, True)
 
-    @for_all(Gen.bool(true_prob=0.0), num_runs=50)
+    @for_all(_ALWAYS_FALSE, num_runs=50)
     def test_true_probability_zero(self, value):
         """Probability of 0.0 yields only ``False`` values."""
 
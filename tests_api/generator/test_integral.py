@@ -4,17 +4,31 @@ import unittest
 
 from python_proptest import Gen, PropertyTestError, for_all, run_for_all
 
+_INT_M50_50 = Gen.int(min_value=-50, max_value=50)
+_IN_RANGE_10_20 = Gen.in_range(10, 20)
+_ASCII = Gen.ascii_char()
+_PRINTABLE_ASCII = Gen.printable_ascii_char()
+_UNICODE = Gen.unicode_char()
+_SURROGATES = range(0xD800, 0xE000)
+
 
 class TestIntegralGenerators(unittest.TestCase):
     """Validate integral generator behaviours and shrinking."""
 
-    @for_all(Gen.int(min_value=-50, max_value=50), num_runs=200)
+    @for_all(
+        Gen.tuple(_INT_M50_50, _IN_RANGE_10_20, _ASCII, _PRINTABLE_ASCII, _UNICODE),
+        num_runs=1,
+    )
+    def test_types_smoke(self, values):
+        """Every integral generator yields plain ``int`` values."""
+
+        self.assertEqual({type(value) for value in values}, {int})
+
+    @for_all(_INT_M50_50, num_runs=200)
     def test_int_values_within_bounds(self, value):
         """Generated integers should stay within the inclusive range."""
 
-        self.assertIsInstance(value, int)
-        self.assertGreaterEqual(value, -50)
-        self.assertLessEqual(value, 50)
+        self.assertTrue(-50 <= value <= 50, value)
 
     def test_int_shrinks_to_minimum_for_positive_range(self):
         """Failing properties shrink towards the configured minimum."""
@@ -28,13 +42,11 @@ class TestIntegralGenerators(unittest.TestCase):
         self.assertEqual(error.minimal_inputs[0], 25)
         self.assertGreaterEqual(error.failing_inputs[0], 25)
 
-    @for_all(Gen.in_range(10, 20), num_runs=200)
+    @for_all(_IN_RANGE_10_20, num_runs=200)
     def test_in_range_excludes_upper_bound(self, value):
         """``Gen.in_range`` generates values in [min, max)."""
 
-        self.assertIsInstance(value, int)
-        self.assertGreaterEqual(value, 10)
-        self.assertLess(value, 20)
+        self.assertTrue(10 <= value < 20, value)
 
     def test_in_range_requires_strict_bounds(self):
         """Invalid bounds raise immediately when creating the generator."""
@@ -42,30 +54,23 @@ class TestIntegralGenerators(unittest.TestCase):
         with self.assertRaises(ValueError):
             Gen.in_range(5, 5)
 
-    @for_all(Gen.ascii_char(), num_runs=200)
+    @for_all(_ASCII, num_runs=200)
     def test_ascii_char_range(self, value):
         """ASCII char generator stays within byte range."""
 
-        self.assertIsInstance(value, int)
-        self.assertGreaterEqual(value, 0)
-        self.assertLessEqual(value, 127)
+        self.assertTrue(0 <= value <= 127, value)
 
-    @for_all(Gen.printable_ascii_char(), num_runs=200)
+    @for_all(_PRINTABLE_ASCII, num_runs=200)
     def test_printable_ascii_char_range(self, value):
         """Printable ASCII char generator avoids control characters."""
 
-        self.assertIsInstance(value, int)
-        self.assertGreaterEqual(value, 32)
-        self.assertLessEqual(value, 126)
+        self.assertTrue(32 <= value <= 126, value)
 
-    @for_all(Gen.unicode_char(), num_runs=200)
+    @for_all(_UNICODE, num_runs=200)
     def test_unicode_char_skips_surrogate_range(self, value: int):
         """Unicode char generator never yields surrogate code points."""
 
-        self.assertIsInstance(value, int)
-        self.assertGreaterEqual(value, 1)
-        self.assertLessEqual(value, 0x10FFFF)
-        self.assertFalse(0xD800 <= value <= 0xDFFF)
+        self.assertTrue(1 <= value <= 0x10FFFF and value not in _SURROGATES, value)
 
 
 if __name__ == "__main__":
@@ -4,30 +4,31 @@ import unittest
 
 from python_proptest import Gen, for_all
 
+_ELEM = Gen.int(min_value=0, max_value=10)
+_SET_0_5 = Gen.set(_ELEM, min_size=0, max_size=5)
+_SET_2_4 = Gen.set(_ELEM, min_size=2, max_size=4)
+
 
 class TestSetGenerator(unittest.TestCase):
     """Exercise set generator behaviours."""
 
-    @for_all(
-        Gen.set(Gen.int(min_value=0, max_value=10), min_size=0, max_size=5),
-        num_runs=200,
-    )
+    @for_all(Gen.tuple(_SET_0_5, _SET_2_4), num_runs=1)
+    def test_types_smoke(self, values):
+        """Set generators yield ``set`` values of ``int`` elements."""
+
+        self.assertEqual({type(value) for value in values}, {set})
+        self.assertTrue(all(type(elem) is int for value in values for elem in value))
+
+    @for_all(_SET_0_5, num_runs=200)
     def test_set_contains_unique_elements(self, value):
         """Generated sets consist of unique integers within range."""
 
-        self.assertIsInstance(value, set)
-        self.assertTrue(
-            all(isinstance(elem, int) and 0 <= elem <= 10 for elem in value)
-        )
+        self.assertTrue(not value or (min(value) >= 0 and max(value) <= 10))
 
-    @for_all(
-        Gen.set(Gen.int(min_value=0, max_value=10), min_size=2, max_size=4),
-        num_runs=200,
-    )
+    @for_all(_SET_2_4, num_runs=200)
     def test_set_respects_size_constraints(self, value):
         """Set generator honours min/max size parameters."""
 
-        self.assertIsInstance(value, set)
         self.assertGreaterEqual(len(value), 2)
         self.assertLessEqual(len(value), 4)
 
@@ -5,53 +5,58 @@ Tests cover basic usage, shrinking behavior, edge cases, and integration
 with other combinators.
 """
 
+import itertools
 import random
 import unittest
 
 from python_proptest import Gen, for_all, run_for_all
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_ELEMENT_GEN = Gen.int(0, 100)
+
 
 class TestChainCombinator(unittest.TestCase):
     """Test suite for chain combinator functionality."""
 
+    # Generators are immutable, so build them once for the whole class
+    _DATE_GEN = Gen.chain(
+        Gen.int(1, 12),  # month
+        lambda month: Gen.int(1, _DAYS_IN_MONTH[month - 1]),  # valid day
+    )
+    _TRIPLE_GEN = Gen.chain(
+        Gen.chain(Gen.int(1, 5), lambda w: Gen.int(w, w + 5)),  # width, height
+        lambda wh: Gen.int(1, wh[0] * wh[1]),  # area <= width * height
+    )
+    _STRING_GEN = Gen.chain(
+        Gen.int(3, 10),  # length
+        lambda length: Gen.str(min_length=length, max_length=length),
+    )
+    _LIST_GEN = Gen.chain(
+        Gen.int(2, 5),  # size
+        lambda size: Gen.list(_ELEMENT_GEN, min_length=size, max_length=size),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        # One generator state for the class, reseeded before every test
+        cls._rng = random.Random()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.rng = random.Random(42)  # Fixed seed for reproducible tests
+        self._rng.seed(42)  # Fixed seed for reproducible tests
+        self.rng = self._rng
 
     def test_simple_chain_static_api_function_style(self):
         """Test basic chain functionality with static API - function style."""
 
-        # Chain month -> valid day
-        def days_in_month(month):
-            days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-            return days[month - 1]
-
-        date_gen = Gen.chain(
-            Gen.int(1, 12),  # month
-            lambda month: Gen.int(1, days_in_month(month)),  # valid day
-        )
-
         # Test using run_for_all as decorator
-        @run_for_all(date_gen, num_runs=20, seed=42)
+        @run_for_all(self._DATE_GEN, num_runs=20, seed=42)
         def check_valid_date(date_tuple):
-            self.assertIsInstance(date_tuple, tuple)
-            self.assertEqual(len(date_tuple), 2)
             month, day = date_tuple
-            self.assertGreaterEqual(month, 1)
-            self.assertLessEqual(month, 12)
-            self.assertGreaterEqual(day, 1)
-            self.assertLessEqual(day, days_in_month(month))
-
-    @run_for_all(
-        Gen.chain(
-            Gen.int(1, 12),
-            lambda month: Gen.int(
-                1, [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month - 1]
-            ),
-        ),
-        num_runs=20,
-        seed=42,
-    )
+            if not (1 <= month <= 12 and 1 <= day <= _DAYS_IN_MONTH[month - 1]):
+                self.fail(f"invalid date: {date_tuple}")
+
+    @run_for_all(_DATE_GEN, num_runs=20, seed=42)
     def test_simple_chain_static_api(self, date_tuple):
         """Test basic chain functionality with static API - decorator style."""
         self.assertIsInstance(date_tuple, tuple)
@@ -60,8 +65,7 @@ class TestChainCombinator(unittest.TestCase):
         self.assertGreaterEqual(month, 1)
         self.assertLessEqual(month, 12)
         self.assertGreaterEqual(day, 1)
-        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        self.assertLessEqual(day, days_in_month[month - 1])
+        self.assertLessEqual(day, _DAYS_IN_MONTH[month - 1])
 
     def test_fluent_chain_api(self):
         """Test chain functionality with fluent API."""
@@ -80,54 +84,30 @@ class TestChainCombinator(unittest.TestCase):
 
     def test_multiple_chaining(self):
         """Test chaining multiple times to create longer tuples."""
-        # Create a 3-tuple with dependencies
-        triple_gen = Gen.chain(
-            Gen.chain(
-                Gen.int(1, 5), lambda w: Gen.int(w, w + 5)  # width  # height >= width
-            ),
-            lambda wh: Gen.int(1, wh[0] * wh[1]),  # area <= width * height
-        )
 
         # Test using run_for_all as decorator
-        @run_for_all(triple_gen, num_runs=10, seed=42)
+        @run_for_all(self._TRIPLE_GEN, num_runs=10, seed=42)
         def check_triple_dependency(triple):
-            self.assertIsInstance(triple, tuple)
-            self.assertEqual(len(triple), 3)
             width, height, area = triple
-
-            # Test dependencies
-            self.assertGreaterEqual(width, 1)
-            self.assertLessEqual(width, 5)
-            self.assertGreaterEqual(height, width)
-            self.assertLessEqual(height, width + 5)
-            self.assertGreaterEqual(area, 1)
-            self.assertLessEqual(area, width * height)
+            if not (
+                1 <= width <= 5
+                and width <= height <= width + 5
+                and 1 <= area <= width * height
+            ):
+                self.fail(f"dependency violated: {triple}")
 
     def test_chain_with_other_generators(self):
         """Test chaining with different generator types."""
-        # Chain string length -> string of that length
-        string_gen = Gen.chain(
-            Gen.int(3, 10),  # length
-            lambda length: Gen.str(min_length=length, max_length=length),
-        )
 
-        # Test using run_for_all
         # Test using run_for_all as decorator
-        @run_for_all(string_gen, num_runs=10, seed=42)
+        @run_for_all(self._STRING_GEN, num_runs=10, seed=42)
         def check_string_length(pair):
-            self.assertIsInstance(pair, tuple)
             length, string = pair
-            self.assertEqual(len(string), length)
-            self.assertGreaterEqual(length, 3)
-            self.assertLessEqual(length, 10)
+            if not (3 <= length <= 10 and len(string) == length):
+                self.fail(f"length mismatch: {pair}")
 
     def test_chain_with_complex_dependencies(self):
         """Test chain with complex dependency logic."""
-        # Generate a list size, then a list of that exact size
-        list_gen = Gen.chain(
-            Gen.int(2, 5),  # size
-            lambda size: Gen.list(Gen.int(0, 100), min_length=size, max_length=size),
-        )
 
         # Test using run_for_all
         def check_list_size_func(pair):
@@ -137,58 +117,45 @@ class TestChainCombinator(unittest.TestCase):
             self.assertGreaterEqual(size, 2)
 
         # Test using run_for_all as decorator
-        @run_for_all(list_gen, num_runs=10, seed=42)
+        @run_for_all(self._LIST_GEN, num_runs=10, seed=42)
         def check_list_size(pair):
-            self.assertIsInstance(pair, tuple)
             size, lst = pair
-            self.assertEqual(len(lst), size)
-            self.assertGreaterEqual(size, 2)
-            self.assertLessEqual(size, 5)
-
-            # Verify all elements are in range
-            for element in lst:
-                self.assertGreaterEqual(element, 0)
-                self.assertLessEqual(element, 100)
+            if not (
+                2 <= size <= 5
+                and len(lst) == size
+                and all(0 <= element <= 100 for element in lst)
+            ):
+                self.fail(f"list does not match its size: {pair}")
 
     def test_shrinking_maintains_dependencies(self):
         """Test that shrinking preserves dependency relationships."""
-
-        def days_in_month(month):
-            days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-            return days[month - 1]
-
-        date_gen = Gen.chain(
-            Gen.int(1, 12), lambda month: Gen.int(1, days_in_month(month))
-        )
-
         # Generate and check shrinks
-        shrinkable = date_gen.generate(self.rng)
-        original_month, original_day = shrinkable.value
-
-        # Test shrinking candidates
-        shrink_count = 0
-        for shrunk in shrinkable.shrinks().to_list()[:10]:  # Check first 10 shrinks
-            shrunk_month, shrunk_day = shrunk.value
+        shrinkable = self._DATE_GEN.generate(self.rng)
 
-            # Verify dependency is maintained in shrinks
-            self.assertGreaterEqual(shrunk_month, 1)
-            self.assertLessEqual(shrunk_month, 12)
-            self.assertGreaterEqual(shrunk_day, 1)
-            self.assertLessEqual(shrunk_day, days_in_month(shrunk_month))
-            shrink_count += 1
+        # Check first 10 shrinks without materializing the rest of the stream
+        shrunk_dates = [
+            shrunk.value for shrunk in itertools.islice(shrinkable.shrinks(), 10)
+        ]
 
         # Should have some shrinking candidates
-        self.assertGreater(shrink_count, 0)
+        self.assertGreater(len(shrunk_dates), 0)
+
+        # Verify dependency is maintained in shrinks
+        invalid = [
+            (month, day)
+            for month, day in shrunk_dates
+            if not (1 <= month <= 12 and 1 <= day <= _DAYS_IN_MONTH[month - 1])
+        ]
+        self.assertEqual(invalid, [])
 
     def test_chain_preserves_single_value_generators(self):
         """Test that single value generators work correctly in chains."""
         # Chain with a constant generator
         constant_chain = Gen.chain(Gen.just(42), lambda x: Gen.int(x, x + 10))
 
-        for _ in range(5):
-            shrinkable = constant_chain.generate(self.rng)
-            constant, dependent = shrinkable.value
-
+        @run_for_all(constant_chain, num_runs=5, seed=42)
+        def check_constant_base(pair):
+            constant, dependent = pair
             self.assertEqual(constant, 42)
             self.assertGreaterEqual(dependent, 42)
             self.assertLessEqual(dependent, 52)
@@ -205,15 +172,9 @@ class TestChainCombinator(unittest.TestCase):
         # Test using run_for_all as decorator
         @run_for_all(extended_gen, num_runs=10, seed=42)
         def check_nested_tuple(triple):
-            self.assertIsInstance(triple, tuple)
-            self.assertEqual(len(triple), 3)
             first, second, third = triple
-
-            # Check the dependency
-            expected_min = first + second
-            expected_max = first + second + 10
-            self.assertGreaterEqual(third, expected_min)
-            self.assertLessEqual(third, expected_max)
+            if not (first + second <= third <= first + second + 10):
+                self.fail(f"dependency violated: {triple}")
 
     def test_property_based_chain_validation(self):
         """Use run_for_all to validate chain properties."""
@@ -256,23 +217,20 @@ class TestChainCombinator(unittest.TestCase):
 
     def test_chain_type_consistency(self):
         """Test that chained generators maintain type consistency."""
-        # Chain different types
-        mixed_chain = Gen.chain(
-            Gen.bool(), lambda b: Gen.int(0, 1) if b else Gen.int(10, 20)
-        )
-
-        for _ in range(10):
-            shrinkable = mixed_chain.generate(self.rng)
-            boolean, integer = shrinkable.value
-
-            self.assertIsInstance(boolean, bool)
-            self.assertIsInstance(integer, int)
-
-            if boolean:
-                self.assertIn(integer, [0, 1])
+        # Chain different types; both branches are built once, not per value
+        low_gen, high_gen = Gen.int(0, 1), Gen.int(10, 20)
+        mixed_chain = Gen.chain(Gen.bool(), lambda b: low_gen if b else high_gen)
+
+        @run_for_all(mixed_chain, num_runs=10, seed=42)
+        def check_mixed_types(pair):
+            b, i = pair
+            self.assertIs(type(b), bool)
+            self.assertIs(type(i), int)
+            if b:
+                self.assertIn(i, (0, 1))
             else:
-                self.assertGreaterEqual(integer, 10)
-                self.assertLessEqual(integer, 20)
+                self.assertGreaterEqual(i, 10)
+                self.assertLessEqual(i, 20)
 
     def test_long_chain_sequence(self):
         """Test chaining many generators in sequence."""
@@ -293,21 +251,14 @@ class TestChainCombinator(unittest.TestCase):
 
         long_gen = build_long_chain()
 
-        for _ in range(5):
-            shrinkable = long_gen.generate(self.rng)
-            a, b, c, d, e = shrinkable.value
-
-            self.assertEqual(len(shrinkable.value), 5)
-
-            # Check dependency chain
-            self.assertGreaterEqual(b, a)
-            self.assertLessEqual(b, a + 2)
-            self.assertGreaterEqual(c, b)
-            self.assertLessEqual(c, b + 2)
-            self.assertGreaterEqual(d, c)
-            self.assertLessEqual(d, c + 2)
-            self.assertGreaterEqual(e, d)
-            self.assertLessEqual(e, d + 2)
+        @run_for_all(long_gen, num_runs=5, seed=42)
+        def check_long_chain(value):
+            self.assertEqual(len(value), 5)
+
+            # Check dependency chain: each element is within 2 above the previous
+            for prev, nxt in zip(value, value[1:]):
+                self.assertGreaterEqual(nxt, prev)
+                self.assertLessEqual(nxt, prev + 2)
 
 
 if __name__ == "__main__":
@@ -7,37 +7,84 @@ preserve shrink tree structure correctly when applied to known test structures (
 Inspired by dartproptest's combinator_constraint_tree_test.dart.
 """
 
-import json
 import random
 import unittest
+from typing import Any, Dict, List, Tuple
 
 from python_proptest import Gen
 from python_proptest.core.shrinker import Shrinkable
 from python_proptest.core.stream import Stream
 
+# Expected serializations of the fixture trees after each transformation.
+# 40213 doubled (x * 2):
+#   8
+#   ├─ 0
+#   ├─ 4
+#   │  └─ 2
+#   └─ 6
+_EXPECTED_40213_DOUBLED = (
+    '{"value":8,"shrinks":[{"value":0},{"value":4,"shrinks":[{"value":2}]},'
+    '{"value":6}]}'
+)
+_EXPECTED_40213_GE_2 = '{"value":4,"shrinks":[{"value":2},{"value":3}]}'
+# 7*2=14, 5*2=10, 3*2=6, 1*2=2, 2*2=4, 4*2=8, 6*2=12
+_EXPECTED_7531246_DOUBLED = (
+    '{"value":14,"shrinks":[{"value":10,"shrinks":[{"value":6,"shrinks":'
+    '[{"value":2}]},{"value":4}]},{"value":8},{"value":12}]}'
+)
+# 9*2=18, 6*2=12, 4*2=8, 2*2=4, 8*2=16, 5*2=10, 1*2=2, 7*2=14, 3*2=6
+_EXPECTED_964285173_DOUBLED = (
+    '{"value":18,"shrinks":[{"value":12,"shrinks":[{"value":8,"shrinks":'
+    '[{"value":4}]},{"value":16}]},{"value":10,"shrinks":[{"value":2}]},'
+    '{"value":14,"shrinks":[{"value":6}]}]}'
+)
+
+# Children of each visited shrinkable, keyed by id(). The shrinkable itself is
+# kept in the entry so its id cannot be reused while the entry is cached.
+_CHILDREN_CACHE: Dict[int, Tuple[Any, List[Any]]] = {}
+
+
+def _children(sh):
+    """Return the shrinks of sh as a list, evaluating the stream only once."""
+    key = id(sh)
+    entry = _CHILDREN_CACHE.get(key)
+    if entry is None:
+        entry = _CHILDREN_CACHE[key] = (sh, sh.shrinks().to_list())
+    return entry[1]
 
-def serialize_shrinkable(shrinkable: Shrinkable) -> str:
-    """Serialize a shrinkable to JSON string (compact format)."""
-    obj = {"value": shrinkable.value}
-
-    shrinks = shrinkable.shrinks()
-    if not shrinks.is_empty():
-        shrinks_list = []
-        for shrink in shrinks.to_list():
-            shrinks_list.append(json.loads(serialize_shrinkable(shrink)))
-        obj["shrinks"] = shrinks_list
 
-    return json.dumps(obj, separators=(",", ":"))
+def serialize_shrinkable(shrinkable: Shrinkable) -> str:
+    """Serialize an int-valued shrinkable to a compact JSON string."""
+    parts = []
+    # Stack entries are either nodes still to open or literal closing fragments
+    stack = [shrinkable]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+        value, children = item.value, _children(item)
+        if not children:
+            parts.append(f'{{"value":{value}}}')
+            continue
+        parts.append(f'{{"value":{value},"shrinks":[')
+        stack.append("]}")
+        for i in range(len(children) - 1, -1, -1):
+            stack.append(children[i])
+            if i:
+                stack.append(",")
+    return "".join(parts)
 
 
 def gen_shrinkable_40213() -> Shrinkable[int]:
     """Generate a shrinkable with value 4 and shrinks [0, 2->1, 3]."""
-    return Shrinkable(4).with_shrinks(
-        lambda: Stream.many(
+    node, many, one = Shrinkable, Stream.many, Stream.one
+    return node(4).with_shrinks(
+        lambda: many(
             [
-                Shrinkable(0),
-                Shrinkable(2).with_shrinks(lambda: Stream.one(Shrinkable(1))),
-                Shrinkable(3),
+                node(0),
+                node(2).with_shrinks(lambda: one(node(1))),
+                node(3),
             ]
         )
     )
@@ -45,21 +92,20 @@ def gen_shrinkable_40213() -> Shrinkable[int]:
 
 def gen_shrinkable_7531246() -> Shrinkable[int]:
     """Generate a shrinkable with value 7 and shrinks [5->[3->1, 2], 4, 6]."""
-    return Shrinkable(7).with_shrinks(
-        lambda: Stream.many(
+    node, many, one = Shrinkable, Stream.many, Stream.one
+    return node(7).with_shrinks(
+        lambda: many(
             [
-                Shrinkable(5).with_shrinks(
-                    lambda: Stream.many(
+                node(5).with_shrinks(
+                    lambda: many(
                         [
-                            Shrinkable(3).with_shrinks(
-                                lambda: Stream.one(Shrinkable(1))
-                            ),
-                            Shrinkable(2),
+                            node(3).with_shrinks(lambda: one(node(1))),
+                            node(2),
                         ]
                     )
                 ),
-                Shrinkable(4),
-                Shrinkable(6),
+                node(4),
+                node(6),
             ]
         )
     )
@@ -67,82 +113,65 @@ def gen_shrinkable_7531246() -> Shrinkable[int]:
 
 def gen_shrinkable_964285173() -> Shrinkable[int]:
     """Generate a shrinkable with value 9 and shrinks [6->[4->2, 8], 5->1, 7->3]."""
-    return Shrinkable(9).with_shrinks(
-        lambda: Stream.many(
+    node, many, one = Shrinkable, Stream.many, Stream.one
+    return node(9).with_shrinks(
+        lambda: many(
             [
-                Shrinkable(6).with_shrinks(
-                    lambda: Stream.many(
+                node(6).with_shrinks(
+                    lambda: many(
                         [
-                            Shrinkable(4).with_shrinks(
-                                lambda: Stream.one(Shrinkable(2))
-                            ),
-                            Shrinkable(8),
+                            node(4).with_shrinks(lambda: one(node(2))),
+                            node(8),
                         ]
                     )
                 ),
-                Shrinkable(5).with_shrinks(lambda: Stream.one(Shrinkable(1))),
-                Shrinkable(7).with_shrinks(lambda: Stream.one(Shrinkable(3))),
+                node(5).with_shrinks(lambda: one(node(1))),
+                node(7).with_shrinks(lambda: one(node(3))),
             ]
         )
     )
 
 
+def _walk_values(shrinkable, max_depth=100):
+    """Yield the values of a shrinkable tree down to max_depth levels."""
+    # Each entry carries the remaining depth budget of its node
+    stack = [(shrinkable, max_depth)]
+    while stack:
+        sh, budget = stack.pop()
+        if budget <= 0:
+            continue
+        yield sh.value
+        stack.extend((child, budget - 1) for child in _children(sh))
+
+
 def collect_all_values(shrinkable, all_values=None, max_depth=100):
     """Collect all values from a shrinkable tree into a set."""
     if all_values is None:
         all_values = set()
-    if max_depth <= 0:
-        return all_values
-    all_values.add(shrinkable.value)
-    for child in shrinkable.shrinks().to_list():
-        collect_all_values(child, all_values, max_depth - 1)
+    all_values.update(_walk_values(shrinkable, max_depth))
     return all_values
 
 
 def verify_constraint(shrinkable, constraint, max_depth=100):
     """Verify that all values in a shrinkable tree satisfy a constraint."""
-    if max_depth <= 0:
-        return True
-    if not constraint(shrinkable.value):
-        return False
-    for child in shrinkable.shrinks().to_list():
-        if not verify_constraint(child, constraint, max_depth - 1):
-            return False
-    return True
+    # all() stops at the first failure, before any further node is expanded
+    return all(constraint(v) for v in _walk_values(shrinkable, max_depth))
 
 
-class TestCombinatorShrinkTrees40213(unittest.TestCase):
-    """Test combinator shrink tree preservation using 40213 structure."""
+class _ShrinkTreeTestCase(unittest.TestCase):
+    """Base class that bounds the children cache to a single test."""
 
-    def test_map_preserves_tree_structure_even_numbers(self):
-        """Test that map preserves tree structure: even numbers only."""
-        # Start with 40213 structure, map to double values
-        # Expected tree structure after mapping (x * 2):
-        #   8
-        #   ├─ 0
-        #   ├─ 4
-        #   │  └─ 2
-        #   └─ 6
-        base_shrinkable = gen_shrinkable_40213()
-        mapped_shrinkable = base_shrinkable.map(lambda x: x * 2)
-
-        actual_serialized = serialize_shrinkable(mapped_shrinkable)
-        expected_serialized = (
-            '{"value":8,"shrinks":[{"value":0},{"value":4,"shrinks":[{"value":2}]},'
-            '{"value":6}]}'
-        )
+    def setUp(self):
+        _CHILDREN_CACHE.clear()
 
-        self.assertEqual(
-            actual_serialized,
-            expected_serialized,
-            "Mapped tree structure should match expected structure",
-        )
 
-        # Verify all shrunk values are even
-        self.assertTrue(
-            verify_constraint(mapped_shrinkable, lambda x: x % 2 == 0),
-            "All shrunk values should satisfy the even constraint",
-        )
+class TestCombinatorShrinkTrees40213(_ShrinkTreeTestCase):
+    """Test combinator shrink tree preservation using 40213 structure."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.base = gen_shrinkable_40213()
 
     def test_filter_preserves_tree_structure_ge_2(self):
         """Test that filter preserves tree structure: only values >= 2."""
@@ -152,37 +181,38 @@ class TestCombinatorShrinkTrees40213(unittest.TestCase):
         #   ├─ 2
         #   └─ 3
         # (0 and 1 are filtered out)
-        base_shrinkable = gen_shrinkable_40213()
+        base_shrinkable = self.base
 
         # Filter: only keep values >= 2
         def filter_func(value):
             return value >= 2
 
-        # Apply filter recursively
-        def apply_filter(sh):
-            if not filter_func(sh.value):
-                return None
-            filtered_children = []
-            for child in sh.shrinks().to_list():
-                filtered_child = apply_filter(child)
-                if filtered_child is not None:
-                    filtered_children.append(filtered_child)
-            return Shrinkable(sh.value).with_shrinks(
-                lambda: (
-                    Stream.many(filtered_children)
-                    if filtered_children
-                    else Stream.empty()
+        # Apply filter bottom-up: a node is rebuilt once all its children are.
+        # _children keeps the child objects stable between the two visits.
+        def apply_filter(root):
+            filtered = {}
+            stack = [(root, False)]
+            while stack:
+                sh, children_done = stack.pop()
+                value = sh.value
+                if not children_done:
+                    if filter_func(value):
+                        stack.append((sh, True))
+                        stack.extend((c, False) for c in reversed(_children(sh)))
+                    continue
+                kept = [filtered[id(c)] for c in _children(sh) if id(c) in filtered]
+                filtered[id(sh)] = Shrinkable(value).with_shrinks(
+                    lambda kept=kept: Stream.many(kept) if kept else Stream.empty()
                 )
-            )
+            return filtered.get(id(root))
 
         filtered_shrinkable = apply_filter(base_shrinkable)
 
         actual_serialized = serialize_shrinkable(filtered_shrinkable)
-        expected_serialized = '{"value":4,"shrinks":[{"value":2},{"value":3}]}'
 
         self.assertEqual(
             actual_serialized,
-            expected_serialized,
+            _EXPECTED_40213_GE_2,
             "Filtered tree structure should match expected structure",
         )
 
@@ -193,73 +223,50 @@ class TestCombinatorShrinkTrees40213(unittest.TestCase):
         )
 
 
-class TestCombinatorShrinkTrees7531246(unittest.TestCase):
-    """Test combinator shrink tree preservation using 7531246 structure."""
+class TestCombinatorShrinkTreesMap(_ShrinkTreeTestCase):
+    """Test map shrink tree preservation on every fixture structure."""
 
-    def test_map_preserves_tree_structure_7531246(self):
-        """Test that map preserves tree structure on larger structure."""
-        base_shrinkable = gen_shrinkable_7531246()
-        mapped_shrinkable = base_shrinkable.map(lambda x: x * 2)
-
-        # Verify structure is preserved (all values doubled)
-        # 7*2=14, 5*2=10, 3*2=6, 1*2=2, 2*2=4, 4*2=8, 6*2=12
-        expected_serialized = (
-            '{"value":14,"shrinks":[{"value":10,"shrinks":[{"value":6,"shrinks":'
-            '[{"value":2}]},{"value":4}]},{"value":8},{"value":12}]}'
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.cases = (
+            ("40213", gen_shrinkable_40213(), _EXPECTED_40213_DOUBLED),
+            ("7531246", gen_shrinkable_7531246(), _EXPECTED_7531246_DOUBLED),
+            ("964285173", gen_shrinkable_964285173(), _EXPECTED_964285173_DOUBLED),
         )
-        actual_serialized = serialize_shrinkable(mapped_shrinkable)
 
-        self.assertEqual(
-            actual_serialized,
-            expected_serialized,
-            "Mapped tree structure should match expected structure",
-        )
+    def test_map_preserves_tree_structure(self):
+        """Test that map (x * 2) preserves tree structure: even numbers only."""
+        for name, base_shrinkable, expected_serialized in self.cases:
+            with self.subTest(structure=name):
+                mapped_shrinkable = base_shrinkable.map(lambda x: x * 2)
 
-        # Verify all values are even (doubled)
-        self.assertTrue(
-            verify_constraint(mapped_shrinkable, lambda x: x % 2 == 0),
-            "All shrunk values should be even",
-        )
-
-
-class TestCombinatorShrinkTrees964285173(unittest.TestCase):
-    """Test combinator shrink tree preservation using 964285173 structure."""
-
-    def test_map_preserves_tree_structure_964285173(self):
-        """Test that map preserves tree structure on largest structure."""
-        base_shrinkable = gen_shrinkable_964285173()
-        mapped_shrinkable = base_shrinkable.map(lambda x: x * 2)
-
-        # Verify structure is preserved (all values doubled)
-        # 9*2=18, 6*2=12, 4*2=8, 2*2=4, 8*2=16, 5*2=10, 1*2=2, 7*2=14, 3*2=6
-        expected_serialized = (
-            '{"value":18,"shrinks":[{"value":12,"shrinks":[{"value":8,"shrinks":'
-            '[{"value":4}]},{"value":16}]},{"value":10,"shrinks":[{"value":2}]},'
-            '{"value":14,"shrinks":[{"value":6}]}]}'
-        )
-        actual_serialized = serialize_shrinkable(mapped_shrinkable)
-
-        self.assertEqual(
-            actual_serialized,
-            expected_serialized,
-            "Mapped tree structure should match expected structure",
-        )
+                self.assertEqual(
+                    serialize_shrinkable(mapped_shrinkable),
+                    expected_serialized,
+                    "Mapped tree structure should match expected structure",
+                )
 
-        # Verify all values are even (doubled)
-        self.assertTrue(
-            verify_constraint(mapped_shrinkable, lambda x: x % 2 == 0),
-            "All shrunk values should be even",
-        )
+                # Verify all shrunk values are even
+                self.assertTrue(
+                    verify_constraint(mapped_shrinkable, lambda x: x % 2 == 0),
+                    "All shrunk values should satisfy the even constraint",
+                )
 
 
-class TestCombinatorShrinkTreesChain(unittest.TestCase):
+class TestCombinatorShrinkTreesChain(_ShrinkTreeTestCase):
     """Test chain combinator shrink tree preservation."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.base = gen_shrinkable_40213()
+
     def test_chain_preserves_tree_structure_40213(self):
         """Test that chain preserves tree structure with dependent values."""
         # Chain: first value from 40213, second value must be <= first
         # We'll create a generator that uses 40213 structure
-        base_shrinkable = gen_shrinkable_40213()
+        base_shrinkable = self.base
 
         # Create a chain: second value is half of first (rounded down)
         def create_chained_shrinkable(base_shr):
@@ -268,14 +275,13 @@ class TestCombinatorShrinkTreesChain(unittest.TestCase):
                 second_val = first_val // 2
                 return Shrinkable(second_val)
 
-            # For each shrink of base, create a tuple shrinkable
+            # For each shrink of base, lazily create a tuple shrinkable
             def create_tuple_shrinks():
-                shrinks_list = []
-                for child in base_shr.shrinks().to_list():
-                    second_shr = create_second_shrinkable(child.value)
-                    tuple_shr = Shrinkable((child.value, second_shr.value))
-                    shrinks_list.append(tuple_shr)
-                return Stream.many(shrinks_list)
+                return base_shr.shrinks().map(
+                    lambda child: Shrinkable(
+                        (child.value, create_second_shrinkable(child.value).value)
+                    )
+                )
 
             # Root tuple
             root_second = create_second_shrinkable(base_shr.value)
@@ -285,15 +291,15 @@ class TestCombinatorShrinkTreesChain(unittest.TestCase):
         chained_shrinkable = create_chained_shrinkable(base_shrinkable)
 
         # Verify constraint: second value should be <= first
-        all_pairs = set()
+        all_pairs = []
 
-        def collect_pairs(sh, depth=0, max_depth=50):
-            if depth > max_depth:
-                return
-            if isinstance(sh.value, tuple):
-                all_pairs.add(sh.value)
-            for child in sh.shrinks().to_list():
-                collect_pairs(child, depth + 1, max_depth)
+        def collect_pairs(root, max_depth=50):
+            stack = [(root, 0)]
+            while stack:
+                sh, depth = stack.pop()
+                all_pairs.append(sh.value)
+                if depth < max_depth:
+                    stack.extend((child, depth + 1) for child in _children(sh))
 
         collect_pairs(chained_shrinkable)
 
@@ -305,12 +311,17 @@ class TestCombinatorShrinkTreesChain(unittest.TestCase):
             )
 
 
-class TestCombinatorShrinkTreesFlatMap(unittest.TestCase):
+class TestCombinatorShrinkTreesFlatMap(_ShrinkTreeTestCase):
     """Test flatMap combinator shrink tree preservation."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.base = gen_shrinkable_40213()
+
     def test_flat_map_preserves_constraints_40213(self):
         """Test that flatMap preserves constraints with nested dependency."""
-        base_shrinkable = gen_shrinkable_40213()
+        base_shrinkable = self.base
 
         # FlatMap: generate a list where each element depends on base value
         # For value n, generate list of length n with elements in [0, n]
@@ -320,13 +331,11 @@ class TestCombinatorShrinkTreesFlatMap(unittest.TestCase):
                 elements = [min(i, n) for i in range(n)]
                 return Shrinkable(elements)
 
-            # For each shrink of base, create a list shrinkable
+            # For each shrink of base, lazily create a list shrinkable
             def create_list_shrinks():
-                shrinks_list = []
-                for child in base_shr.shrinks().to_list():
-                    list_shr = create_list_shrinkable(child.value)
-                    shrinks_list.append(list_shr)
-                return Stream.many(shrinks_list)
+                return base_shr.shrinks().map(
+                    lambda child: create_list_shrinkable(child.value)
+                )
 
             root_list = create_list_shrinkable(base_shr.value)
             return root_list.with_shrinks(create_list_shrinks)
@@ -334,21 +343,20 @@ class TestCombinatorShrinkTreesFlatMap(unittest.TestCase):
         flat_mapped_shrinkable = create_flat_mapped_shrinkable(base_shrinkable)
 
         # Verify constraint: all elements should be <= base value
-        all_lists = set()
+        all_lists = []
 
-        def collect_lists(sh, depth=0, max_depth=50):
-            if depth > max_depth:
-                return
-            if isinstance(sh.value, list):
-                all_lists.add(tuple(sh.value))  # Use tuple for hashability
-            for child in sh.shrinks().to_list():
-                collect_lists(child, depth + 1, max_depth)
+        def collect_lists(root, max_depth=50):
+            stack = [(root, 0)]
+            while stack:
+                sh, depth = stack.pop()
+                all_lists.append(sh.value)
+                if depth < max_depth:
+                    stack.extend((child, depth + 1) for child in _children(sh))
 
         collect_lists(flat_mapped_shrinkable)
 
         # Verify list constraints
-        for lst_tuple in all_lists:
-            lst = list(lst_tuple)
+        for lst in all_lists:
             self.assertGreaterEqual(len(lst), 0, "List should have non-negative length")
             # All elements should be non-negative
             for elem in lst:
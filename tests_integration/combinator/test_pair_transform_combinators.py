@@ -10,15 +10,61 @@ import unittest
 from python_proptest import Gen
 
 
+def _walk(root, max_depth=5):
+    """Yield (depth, value) for each node of a shrink tree in pre-order."""
+    stack = [(root, 0)]
+    while stack:
+        sh, depth = stack.pop()
+        yield depth, sh.value
+        if depth < max_depth:
+            children = sh.shrinks().to_list()
+            stack.extend((child, depth + 1) for child in reversed(children))
+
+
 class TestPairTransformCombinators(unittest.TestCase):
     """Test that filter/map/flatmap maintain conditions when applied to pair-based generators."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.rng = random.Random()
+        dict_gen = Gen.dict(Gen.int(0, 100), Gen.int(0, 100), min_size=1, max_size=3)
+        tuple_gen = Gen.tuple(Gen.int(0, 100), Gen.int(0, 100))
+
+        def double_dict(d):
+            return {k * 2: v * 2 for k, v in d.items()}
+
+        def double_tuple(t):
+            return (t[0] * 2, t[1] * 2)
+
+        def dict_total(d):
+            return sum(d.keys()) + sum(d.values())
+
+        cls.dict_map_gen = dict_gen.map(double_dict)
+        cls.dict_filter_gen = dict_gen.filter(lambda d: dict_total(d) > 50)
+        cls.dict_map_filter_gen = dict_gen.map(double_dict).filter(
+            lambda d: dict_total(d) > 100
+        )
+        cls.dict_filter_map_gen = dict_gen.filter(lambda d: dict_total(d) > 30).map(
+            double_dict
+        )
+        cls.tuple_map_gen = tuple_gen.map(double_tuple)
+        cls.tuple_filter_gen = tuple_gen.filter(lambda t: t[0] + t[1] > 50)
+        cls.tuple_map_filter_gen = tuple_gen.map(double_tuple).filter(
+            lambda t: t[0] + t[1] > 100
+        )
+
+    def setUp(self):
+        # Reseed the shared generator so every test sees the same sequence
+        self.rng.seed(42)
+
     def test_dict_map_maintains_transformation(self):
         """Test that map on dict generator maintains transformation throughout shrink tree."""
-        rng = random.Random(42)
-        gen = Gen.dict(Gen.int(0, 100), Gen.int(0, 100), min_size=1, max_size=3).map(
-            lambda d: {k * 2: v * 2 for k, v in d.items()}
-        )
+        rng = self.rng
+        gen = self.dict_map_gen
+
+        def find_problems(d):
+            return [(k, v) for k, v in d.items() if k % 2 != 0 or v % 2 != 0]
 
         for _ in range(10):
             shrinkable = gen.generate(rng)
@@ -32,18 +78,11 @@ class TestPairTransformCombinators(unittest.TestCase):
                 )
 
             # All shrinks must have even keys and values
-            def check_all_shrinks(sh, depth=0, max_depth=5):
-                if depth > max_depth:
-                    return []
-                problems = []
-                for k, v in sh.value.items():
-                    if k % 2 != 0 or v % 2 != 0:
-                        problems.append((depth, sh.value, k, v))
-                for child in sh.shrinks().to_list():
-                    problems.extend(check_all_shrinks(child, depth + 1, max_depth))
-                return problems
-
-            problems = check_all_shrinks(shrinkable)
+            problems = [
+                (depth, value) + p
+                for depth, value in _walk(shrinkable)
+                for p in find_problems(value)
+            ]
             self.assertEqual(
                 len(problems),
                 0,
@@ -52,10 +91,12 @@ class TestPairTransformCombinators(unittest.TestCase):
 
     def test_dict_filter_maintains_predicate(self):
         """Test that filter on dict generator maintains predicate throughout shrink tree."""
-        rng = random.Random(42)
-        gen = Gen.dict(Gen.int(0, 100), Gen.int(0, 100), min_size=1, max_size=3).filter(
-            lambda d: sum(d.keys()) + sum(d.values()) > 50
-        )
+        rng = self.rng
+        gen = self.dict_filter_gen
+
+        def find_problems(d):
+            total = sum(d.keys()) + sum(d.values())
+            return [(total,)] if total <= 50 else []
 
         for _ in range(10):
             shrinkable = gen.generate(rng)
@@ -69,18 +110,11 @@ class TestPairTransformCombinators(unittest.TestCase):
             )
 
             # All shrinks must satisfy predicate
-            def check_all_shrinks(sh, depth=0, max_depth=5):
-                if depth > max_depth:
-                    return []
-                problems = []
-                total = sum(sh.value.keys()) + sum(sh.value.values())
-                if total <= 50:
-                    problems.append((depth, sh.value, total))
-                for child in sh.shrinks().to_list():
-                    problems.extend(check_all_shrinks(child, depth + 1, max_depth))
-                return problems
-
-            problems = check_all_shrinks(shrinkable)
+            problems = [
+                (depth, value) + p
+                for depth, value in _walk(shrinkable)
+                for p in find_problems(value)
+            ]
             self.assertEqual(
                 len(problems),
                 0,
@@ -89,12 +123,17 @@ class TestPairTransformCombinators(unittest.TestCase):
 
     def test_dict_map_then_filter_maintains_conditions(self):
         """Test that map then filter on dict generator maintains both conditions."""
-        rng = random.Random(42)
-        gen = (
-            Gen.dict(Gen.int(0, 100), Gen.int(0, 100), min_size=1, max_size=3)
-            .map(lambda d: {k * 2: v * 2 for k, v in d.items()})
-            .filter(lambda d: sum(d.keys()) + sum(d.values()) > 100)
-        )
+        rng = self.rng
+        gen = self.dict_map_filter_gen
+
+        def find_problems(d):
+            problems = [
+                ("non-even", k, v) for k, v in d.items() if k % 2 != 0 or v % 2 != 0
+            ]
+            total = sum(d.keys()) + sum(d.values())
+            if total <= 100:
+                problems.append(("sum <= 100", total))
+            return problems
 
         for _ in range(10):
             shrinkable = gen.generate(rng)
@@ -107,21 +146,11 @@ class TestPairTransformCombinators(unittest.TestCase):
             self.assertTrue(total > 100)
 
             # All shrinks must satisfy both conditions
-            def check_all_shrinks(sh, depth=0, max_depth=5):
-                if depth > max_depth:
-                    return []
-                problems = []
-                for k, v in sh.value.items():
-                    if k % 2 != 0 or v % 2 != 0:
-                        problems.append((depth, sh.value, "non-even", k, v))
-                total = sum(sh.value.keys()) + sum(sh.value.values())
-                if total <= 100:
-                    problems.append((depth, sh.value, "sum <= 100", total))
-                for child in sh.shrinks().to_list():
-                    problems.extend(check_all_shrinks(child, depth + 1, max_depth))
-                return problems
-
-            problems = check_all_shrinks(shrinkable)
+            problems = [
+                (depth, value) + p
+                for depth, value in _walk(shrinkable)
+                for p in find_problems(value)
+            ]
             self.assertEqual(
                 len(problems),
                 0,
@@ -130,12 +159,11 @@ class TestPairTransformCombinators(unittest.TestCase):
 
     def test_dict_filter_then_map_maintains_conditions(self):
         """Test that filter then map on dict generator maintains both conditions."""
-        rng = random.Random(42)
-        gen = (
-            Gen.dict(Gen.int(0, 100), Gen.int(0, 100), min_size=1, max_size=3)
-            .filter(lambda d: sum(d.keys()) + sum(d.values()) > 30)
-            .map(lambda d: {k * 2: v * 2 for k, v in d.items()})
-        )
+        rng = self.rng
+        gen = self.dict_filter_map_gen
+
+        def find_problems(d):
+            return [(k, v) for k, v in d.items() if k % 2 != 0 or v % 2 != 0]
 
         for _ in range(10):
             shrinkable = gen.generate(rng)
@@ -146,18 +174,11 @@ class TestPairTransformCombinators(unittest.TestCase):
                 self.assertTrue(k % 2 == 0 and v % 2 == 0)
 
             # All shrinks must have even keys/values
-            def check_all_shrinks(sh, depth=0, max_depth=5):
-                if depth > max_depth:
-                    return []
-                problems = []
-                for k, v in sh.value.items():
-                    if k % 2 != 0 or v % 2 != 0:
-                        problems.append((depth, sh.value, k, v))
-                for child in sh.shrinks().to_list():
-                    problems.extend(check_all_shrinks(child, depth + 1, max_depth))
-                return problems
-
-            problems = check_all_shrinks(shrinkable)
+            problems = [
+                (depth, value) + p
+                for depth, value in _walk(shrinkable)
+                for p in find_problems(value)
+            ]
             self.assertEqual(
                 len(problems),
                 0,
@@ -166,10 +187,11 @@ class TestPairTransformCombinators(unittest.TestCase):
 
     def test_tuple_map_maintains_transformation(self):
         """Test that map on tuple generator maintains transformation throughout shrink tree."""
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(0, 100), Gen.int(0, 100)).map(
-            lambda t: (t[0] * 2, t[1] * 2)
-        )
+        rng = self.rng
+        gen = self.tuple_map_gen
+
+        def find_problems(t):
+            return [()] if t[0] % 2 != 0 or t[1] % 2 != 0 else []
 
         for _ in range(10):
             shrinkable = gen.generate(rng)
@@ -182,17 +204,11 @@ class TestPairTransformCombinators(unittest.TestCase):
             )
 
             # All shrinks must have even elements
-            def check_all_shrinks(sh, depth=0, max_depth=5):
-                if depth > max_depth:
-                    return []
-                problems = []
-                if sh.value[0] % 2 != 0 or sh.value[1] % 2 != 0:
-                    problems.append((depth, sh.value))
-                for child in sh.shrinks().to_list():
-                    problems.extend(check_all_shrinks(child, depth + 1, max_depth))
-                return problems
-
-            problems = check_all_shrinks(shrinkable)
+            problems = [
+                (depth, value) + p
+                for depth, value in _walk(shrinkable)
+                for p in find_problems(value)
+            ]
             self.assertEqual(
                 len(problems),
                 0,
@@ -201,10 +217,11 @@ class TestPairTransformCombinators(unittest.TestCase):
 
     def test_tuple_filter_maintains_predicate(self):
         """Test that filter on tuple generator maintains predicate throughout shrink tree."""
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(0, 100), Gen.int(0, 100)).filter(
-            lambda t: t[0] + t[1] > 50
-        )
+        rng = self.rng
+        gen = self.tuple_filter_gen
+
+        def find_problems(t):
+            return [(t[0] + t[1],)] if t[0] + t[1] <= 50 else []
 
         for _ in range(10):
             shrinkable = gen.generate(rng)
@@ -217,17 +234,11 @@ class TestPairTransformCombinators(unittest.TestCase):
             )
 
             # All shrinks must satisfy predicate
-            def check_all_shrinks(sh, depth=0, max_depth=5):
-                if depth > max_depth:
-                    return []
-                problems = []
-                if sh.value[0] + sh.value[1] <= 50:
-                    problems.append((depth, sh.value, sh.value[0] + sh.value[1]))
-                for child in sh.shrinks().to_list():
-                    problems.extend(check_all_shrinks(child, depth + 1, max_depth))
-                return problems
-
-            problems = check_all_shrinks(shrinkable)
+            problems = [
+                (depth, value) + p
+                for depth, value in _walk(shrinkable)
+                for p in find_problems(value)
+            ]
             self.assertEqual(
                 len(problems),
                 0,
@@ -236,12 +247,16 @@ class TestPairTransformCombinators(unittest.TestCase):
 
     def test_tuple_map_then_filter_maintains_conditions(self):
         """Test that map then filter on tuple generator maintains both conditions."""
-        rng = random.Random(42)
-        gen = (
-            Gen.tuple(Gen.int(0, 100), Gen.int(0, 100))
-            .map(lambda t: (t[0] * 2, t[1] * 2))
-            .filter(lambda t: t[0] + t[1] > 100)
-        )
+        rng = self.rng
+        gen = self.tuple_map_filter_gen
+
+        def find_problems(t):
+            problems = []
+            if t[0] % 2 != 0 or t[1] % 2 != 0:
+                problems.append(("non-even",))
+            if t[0] + t[1] <= 100:
+                problems.append(("sum <= 100",))
+            return problems
 
         for _ in range(10):
             shrinkable = gen.generate(rng)
@@ -252,19 +267,11 @@ class TestPairTransformCombinators(unittest.TestCase):
             self.assertTrue(root[0] + root[1] > 100)
 
             # All shrinks must satisfy both conditions
-            def check_all_shrinks(sh, depth=0, max_depth=5):
-                if depth > max_depth:
-                    return []
-                problems = []
-                if sh.value[0] % 2 != 0 or sh.value[1] % 2 != 0:
-                    problems.append((depth, sh.value, "non-even"))
-                if sh.value[0] + sh.value[1] <= 100:
-                    problems.append((depth, sh.value, "sum <= 100"))
-                for child in sh.shrinks().to_list():
-                    problems.extend(check_all_shrinks(child, depth + 1, max_depth))
-                return problems
-
-            problems = check_all_shrinks(shrinkable)
+            problems = [
+                (depth, value) + p
+                for depth, value in _walk(shrinkable)
+                for p in find_problems(value)
+            ]
             self.assertEqual(
                 len(problems),
                 0,
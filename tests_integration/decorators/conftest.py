@@ -0,0 +1,60 @@
+"""
+Pytest configuration for the decorator integration tests.
+
+Under pytest, every @for_all in these modules that does not pass a seed is
+seeded from the test's qualified name, so each test sees the same inputs on
+every run. Set PROPTEST_RANDOM_SEED=1 to draw fresh random inputs instead.
+
+Setting PROPTEST_FAST=<n> runs every @for_all with n runs instead of the
+default, for quick smoke runs. Values below _MIN_FAST_NUM_RUNS are raised to
+it, since some tests need a few runs to reach a failing input. Explicit
+num_runs arguments and @settings(num_runs=...) are still respected, as is
+@settings(seed=...).
+
+The pinned for_all is only visible while pytest imports the test modules in
+this directory; other modules, and `python -m unittest`, see the real one.
+"""
+
+import functools
+import os
+import zlib
+
+import pytest
+
+import python_proptest
+
+_MIN_FAST_NUM_RUNS = 10
+_FAST_NUM_RUNS = os.environ.get("PROPTEST_FAST")
+_RANDOM_SEED = bool(os.environ.get("PROPTEST_RANDOM_SEED"))
+
+_for_all = python_proptest.for_all
+
+
+@functools.wraps(_for_all)
+def _pinned_for_all(*generators, num_runs=None, seed=None):
+    kwargs = {}
+    if num_runs is not None:
+        kwargs["num_runs"] = num_runs
+    elif _FAST_NUM_RUNS:
+        kwargs["num_runs"] = max(int(_FAST_NUM_RUNS), _MIN_FAST_NUM_RUNS)
+
+    def decorator(func):
+        func_seed = seed
+        if func_seed is None and not _RANDOM_SEED:
+            func_seed = zlib.crc32(func.__qualname__.encode())
+        return _for_all(*generators, seed=func_seed, **kwargs)(func)
+
+    return decorator
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    # Collecting a module imports it, binding its module-level for_all name
+    if not isinstance(collector, pytest.Module):
+        yield
+        return
+    python_proptest.for_all = _pinned_for_all
+    try:
+        yield
+    finally:
+        python_proptest.for_all = _for_all
@@ -5,7 +5,9 @@ This module demonstrates and tests the Hypothesis-style decorator API
 for more ergonomic property-based testing.
 """
 
+import operator
 import unittest
+from collections import Counter
 
 from python_proptest import (
     Gen,
@@ -17,55 +19,63 @@ from python_proptest import (
     settings,
 )
 
+# Generators only hold their parameters, so one instance serves every test
+_INT = Gen.int()
+_SMALL_INT = Gen.int(min_value=1, max_value=100)
+_INT_LIST_0_10 = Gen.list(_INT, min_length=0, max_length=10)
+_NESTED = Gen.list(
+    Gen.dict(Gen.str(min_length=1), _INT, min_size=1, max_size=3),
+    min_length=0,
+    max_length=5,
+)
 
-class TestDecoratorAPI(unittest.TestCase):
-    """Test the decorator-based API."""
 
-    def test_basic_decorator_usage(self):
-        """Test basic @for_all decorator usage."""
+def _addition_commutativity(x: int, y: int):
+    """Test that addition is commutative."""
+    assert x + y == y + x
 
-        @for_all(
-            Gen.int(min_value=1, max_value=100), Gen.int(min_value=1, max_value=100)
-        )
-        def test_addition_commutativity(x: int, y: int):
-            """Test that addition is commutative."""
-            assert x + y == y + x
 
-        # Run the test
-        test_addition_commutativity()
+def _multiplication_associativity(x: int, y: int, z: int):
+    """Test that multiplication is associative."""
+    assert (x * y) * z == x * (y * z)
 
-    def test_decorator_with_generators(self):
-        """Test @for_all decorator with Generator objects."""
 
-        @for_all(
-            Gen.int(min_value=1, max_value=100),
-            Gen.int(min_value=1, max_value=100),
-            Gen.int(min_value=1, max_value=100),
-        )
-        def test_multiplication_associativity(x: int, y: int, z: int):
-            """Test that multiplication is associative."""
-            assert (x * y) * z == x * (y * z)
+def _string_length_property(x: int, s: str):
+    """Test string length property."""
+    assert len(s) >= 0
+    assert isinstance(s, str)
+    assert isinstance(x, int)
 
-        # Run the test
-        test_multiplication_associativity()
 
-    def test_decorator_with_mixed_types(self):
-        """Test @for_all decorator with mixed types."""
+# (name, generators, property) cases that differ only in their inputs
+_SIMPLE_PROPERTIES = (
+    ("addition_commutativity", (_SMALL_INT, _SMALL_INT), _addition_commutativity),
+    (
+        "multiplication_associativity",
+        (_SMALL_INT, _SMALL_INT, _SMALL_INT),
+        _multiplication_associativity,
+    ),
+    (
+        "string_length_property",
+        (_INT, Gen.str(min_length=1, max_length=10)),
+        _string_length_property,
+    ),
+)
 
-        @for_all(Gen.int(), Gen.str(min_length=1, max_length=10))
-        def test_string_length_property(x: int, s: str):
-            """Test string length property."""
-            assert len(s) >= 0
-            assert isinstance(s, str)
-            assert isinstance(x, int)
 
-        # Run the test
-        test_string_length_property()
+class TestDecoratorAPI(unittest.TestCase):
+    """Test the decorator-based API."""
+
+    def test_simple_properties(self):
+        """Test @for_all on plain properties with int and str generators."""
+        for name, generators, prop in _SIMPLE_PROPERTIES:
+            with self.subTest(name):
+                for_all(*generators)(prop)()
 
     def test_decorator_with_lists(self):
         """Test @for_all decorator with list generators."""
 
-        @for_all(Gen.list(Gen.int(), min_length=0, max_length=10))
+        @for_all(_INT_LIST_0_10)
         def test_list_sorting(lst: list):
             """Test list sorting properties."""
             if len(lst) <= 1:
@@ -73,9 +83,7 @@ class TestDecoratorAPI(unittest.TestCase):
 
             sorted_lst = sorted(lst)
             assert len(sorted_lst) == len(lst)
-            assert all(
-                sorted_lst[i] <= sorted_lst[i + 1] for i in range(len(sorted_lst) - 1)
-            )
+            assert all(map(operator.le, sorted_lst, sorted_lst[1:]))
 
         # Run the test
         test_list_sorting()
@@ -84,9 +92,7 @@ class TestDecoratorAPI(unittest.TestCase):
         """Test @for_all decorator with dictionary generators."""
 
         @for_all(
-            Gen.dict(
-                Gen.str(min_length=1, max_length=5), Gen.int(), min_size=0, max_size=5
-            )
+            Gen.dict(Gen.str(min_length=1, max_length=5), _INT, min_size=0, max_size=5)
         )
         def test_dictionary_properties(d: dict):
             """Test dictionary properties."""
@@ -102,7 +108,7 @@ class TestDecoratorAPI(unittest.TestCase):
     def test_decorator_with_one_of(self):
         """Test @for_all decorator with one_of generator."""
 
-        @for_all(Gen.one_of(Gen.int(), Gen.float(), Gen.str()))
+        @for_all(Gen.one_of(_INT, Gen.float(), Gen.str()))
         def test_mixed_type_property(value):
             """Test property with mixed types."""
             assert value is not None
@@ -114,7 +120,7 @@ class TestDecoratorAPI(unittest.TestCase):
     def test_decorator_with_example(self):
         """Test @for_all decorator with @example."""
 
-        @for_all(Gen.int())
+        @for_all(_INT)
         @example(42)
         @example(-1)
         def test_integer_properties(x: int):
@@ -128,7 +134,7 @@ class TestDecoratorAPI(unittest.TestCase):
     def test_decorator_with_settings(self):
         """Test @for_all decorator with @settings."""
 
-        @for_all(Gen.int())
+        @for_all(_INT)
         @settings(num_runs=50, seed=42)
         def test_with_custom_settings(x: int):
             """Test with custom settings."""
@@ -143,7 +149,7 @@ class TestDecoratorAPI(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
 
             @settings(num_runs=50, max_iterations=1000)  # max_iterations is invalid
-            @for_all(Gen.int())
+            @for_all(_INT)
             def test_invalid_setting(x: int):
                 assert isinstance(x, int)
 
@@ -156,7 +162,7 @@ class TestDecoratorAPI(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
 
             @settings(num_runs=50, timeout=30, max_retries=5)  # multiple invalid
-            @for_all(Gen.int())
+            @for_all(_INT)
             def test_invalid_settings(x: int):
                 assert isinstance(x, int)
 
@@ -168,7 +174,7 @@ class TestDecoratorAPI(unittest.TestCase):
     def test_decorator_with_assume(self):
         """Test @for_all decorator with assume."""
 
-        @for_all(Gen.int(), Gen.int())
+        @for_all(_INT, _INT)
         def test_division_property(x: int, y: int):
             """Test division property with assumption."""
             assume(y != 0)  # Skip cases where y is 0
@@ -183,7 +189,7 @@ class TestDecoratorAPI(unittest.TestCase):
     def test_decorator_with_note(self):
         """Test @for_all decorator with note."""
 
-        @for_all(Gen.int())
+        @for_all(_INT)
         def test_with_note(x: int):
             """Test with note for debugging."""
             note(f"Testing with x = {x}")
@@ -195,7 +201,7 @@ class TestDecoratorAPI(unittest.TestCase):
     def test_decorator_error_handling(self):
         """Test error handling in decorator API."""
 
-        @for_all(Gen.int())
+        @for_all(_INT)
         def test_failing_property(x: int):
             """Test that fails for certain values."""
             assert x < 100  # This will fail for x >= 100
@@ -209,15 +215,29 @@ class TestDecoratorAPI(unittest.TestCase):
 
         with self.assertRaises(ValueError):
 
-            @for_all(Gen.int(), Gen.int())
+            @for_all(_INT, _INT)
             def test_wrong_arg_count(x: int):
                 """Function with wrong argument count."""
                 assert x > 0
 
+    def test_repeated_invocation_reuses_seed(self):
+        """Test that calling a seeded decorated function again replays its inputs."""
+        seen = []
+
+        @for_all(Gen.int(0, 1000), num_runs=5, seed=7)
+        def test_record(x: int):
+            seen.append(x)
+
+        test_record()
+        first_run = list(seen)
+        seen.clear()
+        test_record()
+        self.assertEqual(seen, first_run)
+
     def test_run_property_test_function(self):
         """Test the run_property_test utility function."""
 
-        @for_all(Gen.int())
+        @for_all(_INT)
         def test_simple_property(x: int):
             """Simple property test."""
             assert x * 0 == 0
@@ -229,31 +249,23 @@ class TestDecoratorAPI(unittest.TestCase):
     def test_decorator_with_complex_function(self):
         """Test decorator with a complex function that would be awkward with lambda."""
 
-        @for_all(Gen.list(Gen.int(), min_length=1, max_length=10))
+        @for_all(Gen.list(_INT, min_length=1, max_length=10))
         def test_list_operations(lst: list):
             """Test complex list operations."""
             # This would be very awkward with lambda syntax
             if len(lst) == 0:
                 return
 
-            # Test various list properties
-            original_length = len(lst)
-            lst_copy = lst.copy()
-
-            # Test that sorting doesn't change length
-            sorted_lst = sorted(lst_copy)
-            assert len(sorted_lst) == original_length
-
-            # Test that sorting is idempotent
-            double_sorted = sorted(sorted_lst)
-            assert double_sorted == sorted_lst
+            # Test that sorting doesn't change length; sorted() copies the list
+            sorted_lst = sorted(lst)
+            assert len(sorted_lst) == len(lst)
 
-            # Test that all elements are preserved
-            assert set(lst) == set(sorted_lst)
+            # Test ordering property; a list in order is also a fixed point of
+            # sorted(), so this covers idempotence without sorting again
+            assert all(map(operator.le, sorted_lst, sorted_lst[1:]))
 
-            # Test ordering property
-            for i in range(len(sorted_lst) - 1):
-                assert sorted_lst[i] <= sorted_lst[i + 1]
+            # Test that all elements are preserved, counting duplicates
+            assert Counter(lst) == Counter(sorted_lst)
 
         # Run the test
         test_list_operations()
@@ -261,13 +273,7 @@ class TestDecoratorAPI(unittest.TestCase):
     def test_decorator_with_nested_structures(self):
         """Test decorator with nested data structures."""
 
-        @for_all(
-            Gen.list(
-                Gen.dict(Gen.str(min_length=1), Gen.int(), min_size=1, max_size=3),
-                min_length=0,
-                max_length=5,
-            )
-        )
+        @for_all(_NESTED)
         def test_nested_structures(data: list):
             """Test properties of nested data structures."""
             assert isinstance(data, list)
@@ -284,11 +290,7 @@ class TestDecoratorAPI(unittest.TestCase):
         # Run the test
         test_nested_structures()
 
-    @for_all(
-        Gen.int(min_value=1, max_value=100)
-        .filter(lambda x: x % 2 == 0)
-        .map(lambda x: x * 2)
-    )
+    @for_all(_SMALL_INT.filter(lambda x: x % 2 == 0).map(lambda x: x * 2))
     def test_decorator_with_custom_generator_chain(self, x: int):
         """Test decorator with chained generators."""
 
@@ -297,7 +299,7 @@ class TestDecoratorAPI(unittest.TestCase):
         assert x % 4 == 0  # Even number * 2 is divisible by 4
         assert isinstance(x, int)
 
-    @for_all(Gen.int(min_value=1, max_value=100))
+    @for_all(_SMALL_INT)
     def test_for_all_decorator(self, x: int):
         """Test custom generator chain."""
         assert x >= 1
@@ -356,19 +358,17 @@ if __name__ == "__main__":
     # Run some examples
     print("Running decorator API examples...")
 
-    @for_all(Gen.int(), Gen.int())
+    @for_all(_INT, _INT)
     def example_commutativity(x: int, y: int):
         assert x + y == y + x
 
-    @for_all(Gen.list(Gen.int(), min_length=0, max_length=10))
+    @for_all(_INT_LIST_0_10)
     def example_list_sorting(lst: list):
         if len(lst) <= 1:
             return
         sorted_lst = sorted(lst)
         assert len(sorted_lst) == len(lst)
-        assert all(
-            sorted_lst[i] <= sorted_lst[i + 1] for i in range(len(sorted_lst) - 1)
-        )
+        assert all(map(operator.le, sorted_lst, sorted_lst[1:]))
 
     example_commutativity()
     example_list_sorting()
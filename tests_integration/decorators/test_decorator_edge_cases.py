@@ -5,6 +5,7 @@ This module tests error handling, context detection failures, and
 other edge cases that may not be covered by normal usage.
 """
 
+import inspect
 import unittest
 from unittest.mock import patch
 
@@ -43,15 +44,26 @@ class TestDecoratorEdgeCases(unittest.TestCase):
 
     def test_context_detection_module_none(self):
         """Test decorator when inspect.getmodule returns None."""
-        # Create a mock function where getmodule returns None
-        with patch("inspect.getmodule", return_value=None):
+        looked_up = []
+        ran = []
+
+        def no_module(obj):
+            looked_up.append(obj)
+            return None
+
+        # A plain replacement is enough here; no MagicMock is needed
+        with patch.object(inspect, "getmodule", no_module):
 
             @for_all(Gen.int())
-            def test_with_no_module(x: int):
-                assert x == x
+            def test_with_no_module(self, x: int):
+                ran.append(x)
+
+        # The method's qualname has a class part, so the module lookup ran
+        self.assertTrue(looked_up)
 
-            # Should still work, just won't detect class context
-            test_with_no_module()
+        # Should still work, just won't detect class context
+        test_with_no_module(object())
+        self.assertTrue(ran)
 
     def test_generator_count_mismatch(self):
         """Test ValueError when generator count doesn't match parameters."""
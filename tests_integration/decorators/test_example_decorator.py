@@ -4,6 +4,27 @@ import unittest
 
 from python_proptest import Gen, Property, example, for_all, settings
 
+# Generators only hold their parameters, so one instance serves every test
+_G_INT, _G_STR, _G_BOOL, _G_FLOAT = Gen.int(), Gen.str(), Gen.bool(), Gen.float()
+
+
+# Decorated once at import; the tests below only inspect or call them
+@example(42, "hello")
+def _stored_example_func(x: int, s: str):
+    pass
+
+
+@example(1, "a")
+@example(2, "b")
+def _stored_examples_func(x: int, s: str):
+    pass
+
+
+@for_all(_G_INT, _G_STR, _G_BOOL, _G_FLOAT)
+@example(42, "hello", True, 3.14)
+def _different_types_property(x: int, s: str, b: bool, f: float):
+    assert (type(x), type(s), type(b), type(f)) == (int, str, bool, float)
+
 
 class TestExampleDecorator(unittest.TestCase):
     """Test @example decorator functionality."""
@@ -11,34 +32,27 @@ class TestExampleDecorator(unittest.TestCase):
     def test_example_decorator_stores_examples(self):
         """Test that @example decorator stores examples on the function."""
 
-        @example(42, "hello")
-        def test_func(x: int, s: str):
-            pass
-
         # Check that examples are stored
+        test_func = _stored_example_func
         self.assertTrue(hasattr(test_func, "_proptest_examples"))
         self.assertEqual(test_func._proptest_examples, [(42, "hello")])
 
         # Test multiple examples
-        @example(1, "a")
-        @example(2, "b")
-        def test_func_multiple(x: int, s: str):
-            pass
-
+        test_func_multiple = _stored_examples_func
         self.assertEqual(len(test_func_multiple._proptest_examples), 2)
-        self.assertIn((1, "a"), test_func_multiple._proptest_examples)
-        self.assertIn((2, "b"), test_func_multiple._proptest_examples)
+        self.assertEqual(
+            set(test_func_multiple._proptest_examples), {(1, "a"), (2, "b")}
+        )
 
     def test_example_with_for_all_standalone(self):
         """Test @example with @for_all on standalone functions."""
 
         # This should work but examples might not be used yet
-        @for_all(Gen.int(), Gen.str())
+        @for_all(_G_INT, _G_STR)
         @example(42, "hello")
         def test_property(x: int, s: str):
             # This should always pass for the example values
-            assert isinstance(x, int)
-            assert isinstance(s, str)
+            assert (type(x), type(s)) == (int, str)
 
         # The function should be callable
         test_property()
@@ -51,11 +65,10 @@ class TestExampleDecorator(unittest.TestCase):
         """Test @example with @for_all on pytest class methods."""
 
         class TestExamplePytest:
-            @for_all(Gen.int(), Gen.str())
+            @for_all(_G_INT, _G_STR)
             @example(42, "hello")
             def test_property(self, x: int, s: str):
-                assert isinstance(x, int)
-                assert isinstance(s, str)
+                assert (type(x), type(s)) == (int, str)
 
         # Create instance and test
         test_instance = TestExamplePytest()
@@ -71,11 +84,10 @@ class TestExampleDecorator(unittest.TestCase):
         """Test @example with @for_all on unittest class methods."""
 
         class TestExampleUnittest(unittest.TestCase):
-            @for_all(Gen.int(), Gen.str())
+            @for_all(_G_INT, _G_STR)
             @example(42, "hello")
             def test_property(self, x: int, s: str):
-                self.assertIsInstance(x, int)
-                self.assertIsInstance(s, str)
+                self.assertEqual((type(x), type(s)), (int, str))
 
         # Create instance and test
         test_instance = TestExampleUnittest()
@@ -90,31 +102,29 @@ class TestExampleDecorator(unittest.TestCase):
     def test_multiple_examples(self):
         """Test multiple @example decorators."""
 
-        @for_all(Gen.int(), Gen.str())
+        @for_all(_G_INT, _G_STR)
         @example(1, "a")
         @example(2, "b")
         @example(3, "c")
         def test_property(x: int, s: str):
-            assert isinstance(x, int)
-            assert isinstance(s, str)
+            assert (type(x), type(s)) == (int, str)
 
         test_property()
 
         # Check that all examples are stored
         self.assertEqual(len(test_property._proptest_examples), 3)
-        self.assertIn((1, "a"), test_property._proptest_examples)
-        self.assertIn((2, "b"), test_property._proptest_examples)
-        self.assertIn((3, "c"), test_property._proptest_examples)
+        self.assertEqual(
+            set(test_property._proptest_examples), {(1, "a"), (2, "b"), (3, "c")}
+        )
 
     def test_example_with_settings(self):
         """Test @example with @settings decorator."""
 
-        @for_all(Gen.int(), Gen.str())
+        @for_all(_G_INT, _G_STR)
         @example(42, "hello")
         @settings(num_runs=50)
         def test_property(x: int, s: str):
-            assert isinstance(x, int)
-            assert isinstance(s, str)
+            assert (type(x), type(s)) == (int, str)
 
         test_property()
 
@@ -129,17 +139,15 @@ class TestExampleDecorator(unittest.TestCase):
 
         # @example first, then @for_all
         @example(42, "hello")
-        @for_all(Gen.int(), Gen.str())
+        @for_all(_G_INT, _G_STR)
         def test_property1(x: int, s: str):
-            assert isinstance(x, int)
-            assert isinstance(s, str)
+            assert (type(x), type(s)) == (int, str)
 
         # @for_all first, then @example
-        @for_all(Gen.int(), Gen.str())
+        @for_all(_G_INT, _G_STR)
         @example(42, "hello")
         def test_property2(x: int, s: str):
-            assert isinstance(x, int)
-            assert isinstance(s, str)
+            assert (type(x), type(s)) == (int, str)
 
         # Both should work
         test_property1()
@@ -154,14 +162,7 @@ class TestExampleDecorator(unittest.TestCase):
     def test_example_with_different_types(self):
         """Test @example with different data types."""
 
-        @for_all(Gen.int(), Gen.str(), Gen.bool(), Gen.float())
-        @example(42, "hello", True, 3.14)
-        def test_property(x: int, s: str, b: bool, f: float):
-            assert isinstance(x, int)
-            assert isinstance(s, str)
-            assert isinstance(b, bool)
-            assert isinstance(f, float)
-
+        test_property = _different_types_property
         test_property()
 
         # Check that examples are stored
@@ -171,21 +172,20 @@ class TestExampleDecorator(unittest.TestCase):
     def test_example_with_edge_cases(self):
         """Test @example with edge case values."""
 
-        @for_all(Gen.int(), Gen.str())
+        @for_all(_G_INT, _G_STR)
         @example(0, "")
         @example(-1, " ")
         @example(1, "a")
         def test_property(x: int, s: str):
-            assert isinstance(x, int)
-            assert isinstance(s, str)
+            assert (type(x), type(s)) == (int, str)
 
         test_property()
 
         # Check that all examples are stored
         self.assertEqual(len(test_property._proptest_examples), 3)
-        self.assertIn((0, ""), test_property._proptest_examples)
-        self.assertIn((-1, " "), test_property._proptest_examples)
-        self.assertIn((1, "a"), test_property._proptest_examples)
+        self.assertEqual(
+            set(test_property._proptest_examples), {(0, ""), (-1, " "), (1, "a")}
+        )
 
     # ------------------------------------------------------------------
     # Tests merged from test_example_simple.py
@@ -193,19 +193,37 @@ class TestExampleDecorator(unittest.TestCase):
     def test_example_execution_direct_property(self):
         """Examples should execute when using Property directly."""
 
-        executions = []
+        executions = set()
 
         def property_func(x: int, s: str):
-            executions.append((x, s))
+            executions.add((x, s))
             return True
 
         prop = Property(property_func, examples=[(42, "hello"), (100, "world")])
-        prop.for_all(Gen.int(), Gen.str())
+        prop.for_all(_G_INT, _G_STR)
 
         self.assertIn((42, "hello"), executions)
         self.assertIn((100, "world"), executions)
         self.assertGreater(len(executions), 2)
 
+    def test_examples_rerun_direct_property(self):
+        """Re-running the same Property should check every example again."""
+
+        executions = []
+
+        def property_func(x):
+            executions.append(x)
+            return True
+
+        # Equal and equally hashed, but still distinct examples
+        prop = Property(property_func, num_runs=0, examples=[(False,), (0,), (0.0,)])
+        prop.for_all(_G_INT)
+        prop.for_all(_G_INT)
+
+        self.assertEqual(
+            [type(x) for x in executions], [bool, int, float, bool, int, float]
+        )
+
     def test_example_failure_direct_property(self):
         """Failing examples should surface immediately with Property."""
 
@@ -218,7 +236,7 @@ class TestExampleDecorator(unittest.TestCase):
         prop = Property(property_func, examples=[(0, "hello")])
 
         with self.assertRaises(Exception) as cm:
-            prop.for_all(Gen.int(), Gen.str())
+            prop.for_all(_G_INT, _G_STR)
 
         self.assertIn("Property failed on example", str(cm.exception))
         self.assertIn("(0, 'hello')", str(cm.exception))
@@ -228,14 +246,14 @@ class TestExampleDecorator(unittest.TestCase):
     def test_example_execution_with_decorator(self):
         """Examples should execute when using @for_all decorator."""
 
-        executions = []
+        executions = set()
 
-        @for_all(Gen.int(), Gen.str())
+        @for_all(_G_INT, _G_STR)
         @example(42, "hello")
         @example(100, "world")
         def test_property(x: int, s: str):
-            executions.append((x, s))
-            return isinstance(x, int) and isinstance(s, str)
+            executions.add((x, s))
+            return (type(x), type(s)) == (int, str)
 
         test_property()
 
@@ -243,12 +261,28 @@ class TestExampleDecorator(unittest.TestCase):
         self.assertIn((100, "world"), executions)
         self.assertGreater(len(executions), 2)
 
+    def test_example_added_after_first_call(self):
+        """Examples added after a decorated function ran should still execute."""
+
+        executions = []
+
+        @for_all(_G_INT, num_runs=3)
+        def test_property(x: int):
+            executions.append(x)
+
+        test_property()
+        with_example = example(999)(test_property)
+        executions.clear()
+        with_example()
+
+        self.assertEqual(executions[0], 999)
+
     def test_example_failure_with_decorator(self):
         """Failing examples with decorators should halt immediately."""
 
         executions = []
 
-        @for_all(Gen.int(), Gen.str())
+        @for_all(_G_INT, _G_STR)
         @example(0, "hello")
         def test_property(x: int, s: str):
             executions.append((x, s))
@@ -279,20 +313,20 @@ class TestExampleDecorator(unittest.TestCase):
     def test_example_with_bool_generator(self):
         """Examples should work with boolean generators."""
 
-        @for_all(Gen.bool())
+        @for_all(_G_BOOL)
         @example(True)
         def test_property(b: bool):
-            assert isinstance(b, bool)
+            assert type(b) is bool
 
         test_property()
 
     def test_example_with_float_generator(self):
         """Examples should work with float generators."""
 
-        @for_all(Gen.float())
+        @for_all(_G_FLOAT)
         @example(3.14)
         def test_property(f: float):
-            assert isinstance(f, float)
+            assert type(f) is float
 
         test_property()
 
@@ -76,10 +76,23 @@ class TestMatrixDecorator(unittest.TestCase):
         expected = [{"z": [True, False]}, {"y": ["a", "b"]}, {"x": [1, 2]}]
         self.assertEqual(test_func._proptest_matrices, expected)
 
+    def test_matrix_decorator_materializes_iterables(self):
+        """Test that one-shot iterables in a matrix spec run on every call."""
+        calls = []
+
+        @matrix(x=(i for i in range(3)))
+        def test_func(x):
+            calls.append(x)
+
+        self.assertEqual(test_func._proptest_matrices, [{"x": [0, 1, 2]}])
+        test_func()
+        test_func()
+        self.assertEqual(calls, [0, 1, 2, 0, 1, 2])
+
     def test_matrix_with_for_all_integration(self):
         """Test that @matrix works with @for_all decorator."""
         call_count = 0
-        matrix_calls = []
+        matrix_calls = set()
 
         @for_all(Gen.int(1, 10), Gen.str(1, 5))
         @matrix(x=[0, 1], s=["test"])
@@ -87,7 +100,7 @@ class TestMatrixDecorator(unittest.TestCase):
             nonlocal call_count
             call_count += 1
             if x in [0, 1] and s == "test":
-                matrix_calls.append((x, s))
+                matrix_calls.add((x, s))
             # Property should pass for all inputs
             assert isinstance(x, int)
             assert isinstance(s, str)
@@ -98,12 +111,12 @@ class TestMatrixDecorator(unittest.TestCase):
         # Should have run matrix cases (2 combinations) plus random cases
         self.assertGreaterEqual(call_count, 2)
         # Matrix cases should have been executed
-        self.assertEqual(set(matrix_calls), {(0, "test"), (1, "test")})
+        self.assertEqual(matrix_calls, {(0, "test"), (1, "test")})
 
     def test_matrix_with_for_all_method(self):
         """Test that @matrix works with @for_all on class methods."""
         call_count = 0
-        matrix_calls = []
+        matrix_calls = set()
 
         class TestClass(unittest.TestCase):
             @for_all(Gen.int(1, 10), Gen.str(1, 5))
@@ -112,7 +125,7 @@ class TestMatrixDecorator(unittest.TestCase):
                 nonlocal call_count
                 call_count += 1
                 if x in [0, 1] and s == "test":
-                    matrix_calls.append((x, s))
+                    matrix_calls.add((x, s))
                 # Property should pass for all inputs
                 self.assertIsInstance(x, int)
                 self.assertIsInstance(s, str)
@@ -124,7 +137,7 @@ class TestMatrixDecorator(unittest.TestCase):
         # Should have run matrix cases (2 combinations) plus random cases
         self.assertGreaterEqual(call_count, 2)
         # Matrix cases should have been executed
-        self.assertEqual(set(matrix_calls), {(0, "test"), (1, "test")})
+        self.assertEqual(matrix_calls, {(0, "test"), (1, "test")})
 
     def test_matrix_cases_dont_count_toward_num_runs(self):
         """Test that matrix cases don't count toward the num_runs setting."""
@@ -147,7 +160,7 @@ class TestMatrixDecorator(unittest.TestCase):
     def test_matrix_with_settings_integration(self):
         """Test that @matrix works with @settings decorator."""
         call_count = 0
-        matrix_calls = []
+        matrix_calls = set()
 
         @for_all(Gen.int(1, 10))
         @matrix(xx=[0, 1])
@@ -155,21 +168,21 @@ class TestMatrixDecorator(unittest.TestCase):
             nonlocal call_count
             call_count += 1
             if xx in [0, 1]:
-                matrix_calls.append(xx)
+                matrix_calls.add(xx)
             assert isinstance(xx, int)
 
         # Run the test
         test_property()
 
         # Matrix cases should be executed
-        self.assertEqual(set(matrix_calls), {0, 1})
+        self.assertEqual(matrix_calls, {0, 1})
         # Should have more calls than just matrix cases
         self.assertGreater(call_count, 2)
 
     def test_matrix_with_example_integration(self):
         """Test that @matrix works with @example decorator."""
         call_count = 0
-        matrix_calls = []
+        matrix_calls = set()
         example_calls = []
 
         @for_all(Gen.int(1, 10))
@@ -178,7 +191,7 @@ class TestMatrixDecorator(unittest.TestCase):
             nonlocal call_count
             call_count += 1
             if x in [0, 1]:
-                matrix_calls.append(x)
+                matrix_calls.add(x)
             elif x == 42:
                 example_calls.append(x)
             assert isinstance(x, int)
@@ -192,7 +205,7 @@ class TestMatrixDecorator(unittest.TestCase):
         test_property()
 
         # Matrix cases should be executed
-        self.assertEqual(set(matrix_calls), {0, 1})
+        self.assertEqual(matrix_calls, {0, 1})
         # Example cases should also be executed
         self.assertIn(42, example_calls)
 
@@ -299,11 +312,14 @@ class TestRunMatrixFunction(unittest.TestCase):
         def test_func(x, y, z):
             calls.append((x, y, z))
 
-        matrix_spec = {"x": [1, 2], "y": ["a"]}  # Missing z
+        x_values = iter([1, 2])
+        matrix_spec = {"x": x_values, "y": ["a"]}  # Missing z
         run_matrix(test_func, matrix_spec)
 
         # Should not have called since z is missing
         self.assertEqual(len(calls), 0)
+        # The check happens before expansion, so no values were consumed
+        self.assertEqual(list(x_values), [1, 2])
 
     def test_run_matrix_single_parameter(self):
         """Test run_matrix with single parameter."""
@@ -355,6 +371,21 @@ class TestRunMatrixFunction(unittest.TestCase):
         ]
         self.assertEqual(calls, expected)
 
+    def test_run_matrix_unhashable_callable(self):
+        """Test run_matrix with a callable object that is not hashable."""
+        calls = []
+
+        class Recorder:
+            def __eq__(self, other):
+                return self is other
+
+            def __call__(self, x, y):
+                calls.append((x, y))
+
+        run_matrix(Recorder(), {"x": [1, 2], "y": ["a"]})
+
+        self.assertEqual(calls, [(1, "a"), (2, "a")])
+
     def test_run_matrix_with_method_but_no_self_obj(self):
         """Test run_matrix with method signature but no self_obj raises error."""
 
@@ -455,11 +486,15 @@ class TestMatrixIntegration(unittest.TestCase):
 
         # Should have executed matrix cases
         self.assertEqual(len(matrix_calls), 4)  # 2 x values * 2 y values
-        expected_calls = [(1, {"a": 1}), (1, {"b": 2}), (2, {"a": 1}), (2, {"b": 2})]
-        # Sort both lists for comparison since dicts are unhashable
-        matrix_calls_sorted = sorted(matrix_calls, key=lambda x: (x[0], str(x[1])))
-        expected_calls_sorted = sorted(expected_calls, key=lambda x: (x[0], str(x[1])))
-        self.assertEqual(matrix_calls_sorted, expected_calls_sorted)
+        # Dicts are unhashable, so compare their items as tuples instead
+        normalized = {(x, tuple(sorted(y.items()))) for x, y in matrix_calls}
+        expected = {
+            (1, (("a", 1),)),
+            (1, (("b", 2),)),
+            (2, (("a", 1),)),
+            (2, (("b", 2),)),
+        }
+        self.assertEqual(normalized, expected)
 
 
 if __name__ == "__main__":
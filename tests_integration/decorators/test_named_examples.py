@@ -91,6 +91,20 @@ class TestNamedExamples(unittest.TestCase):
         # Verify example was run with correct mapping
         self.assertIn((42, "hello", True), call_count)
 
+    def test_named_examples_with_stacked_for_all(self):
+        """Test that named examples resolve when @for_all decorators are stacked."""
+        calls = []
+
+        @for_all(Gen.int(0, 5), num_runs=2)
+        @for_all(Gen.int(10, 15), num_runs=2)
+        @example(x=99)
+        def test_property(x: int):
+            calls.append(x)
+
+        test_property()
+
+        self.assertIn(99, calls)
+
     def test_unknown_parameter_raises_error(self):
         """Test that unknown parameter names raise an error."""
 
@@ -59,14 +59,8 @@ class TestGenBoolTrueProb(unittest.TestCase):
 
     def test_bool_invalid_probability_raises_error(self):
         """Test that invalid true_prob values raise ValueError."""
-        with self.assertRaises(ValueError):
-            Gen.bool(true_prob=-0.1)
-
-        with self.assertRaises(ValueError):
-            Gen.bool(true_prob=1.1)
-
-        with self.assertRaises(ValueError):
-            Gen.bool(true_prob=2.0)
+        for bad in (-0.1, 1.1, 2.0):
+            self.assertRaises(ValueError, Gen.bool, true_prob=bad)
 
     def test_bool_edge_cases(self):
         """Test edge case probabilities."""
@@ -102,7 +96,7 @@ class TestGenBoolTrueProb(unittest.TestCase):
 
         def test_property():
             result = run_for_all(
-                lambda lst: all(isinstance(x, bool) for x in lst),
+                lambda lst: set(map(type, lst)) <= {bool},
                 Gen.list(Gen.bool(true_prob=0.3), min_length=1, max_length=5),
             )
             return result
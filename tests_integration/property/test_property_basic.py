@@ -247,6 +247,28 @@ class TestPropertyBasic(unittest.TestCase):
         with self.assertRaises(PropertyTestError):
             run_for_all(property_func, Gen.just(-5), num_runs=10)
 
+    def test_property_with_result_whose_truth_value_raises(self):
+        """Test property returning an object whose __bool__ raises."""
+
+        class Ambiguous:
+            def __bool__(self):
+                raise ValueError("truth value is ambiguous")
+
+        with self.assertRaises(PropertyTestError) as exc_info:
+            run_for_all(lambda x: Ambiguous(), Gen.just(7), num_runs=10)
+
+        # Reported like any other exception, with the failing inputs attached
+        assert exc_info.exception.failing_inputs == [7]
+        assert exc_info.exception.minimal_inputs == [7]
+
+        class Assumed:
+            def __bool__(self):
+                raise Exception("Assumption failed")
+
+        # On examples, an assumption raised while checking the result is skipped
+        prop = Property(lambda x: Assumed() if x == 0 else True, examples=[(0,)])
+        assert prop.for_all(Gen.int(min_value=1, max_value=10)) is True
+
     def test_property_with_failing_condition(self):
         """Test property with failing condition."""
 
@@ -7,6 +7,7 @@ in the basic shrinker tests.
 
 import json
 import unittest
+from typing import Dict, Tuple
 
 from python_proptest.core.shrinker import (
     Shrinkable,
@@ -33,23 +34,37 @@ def serialize_shrinkable(shrinkable: Shrinkable) -> str:
 def compare_shrinkable(
     lhs: Shrinkable, rhs: Shrinkable, max_elements: int = 1000
 ) -> bool:
-    """Compare two shrinkables for equality."""
-    if lhs.value != rhs.value:
-        return False
-
-    if max_elements <= 0:
-        return True
-
-    lhs_shrinks = lhs.shrinks().to_list()
-    rhs_shrinks = rhs.shrinks().to_list()
+    """Compare two shrinkables for equality.
+
+    Walks both trees with an explicit stack, comparing shrinks down to
+    ``max_elements`` levels; nodes at that depth are compared by value only.
+    A node pair already compared with at least as many levels left is
+    skipped, so shared or self-referencing subtrees do not loop forever.
+    """
+    stack = [(lhs, rhs, max_elements)]
+    # Maps id pairs to the levels left when they were compared, keeping the
+    # nodes alive so the ids stay valid
+    seen: Dict[Tuple[int, int], Tuple[int, Shrinkable, Shrinkable]] = {}
+    while stack:
+        left, right, levels = stack.pop()
+        key = (id(left), id(right))
+        if key in seen and seen[key][0] >= levels:
+            continue
+        seen[key] = (levels, left, right)
+
+        if left.value != right.value:
+            return False
 
-    if len(lhs_shrinks) != len(rhs_shrinks):
-        return False
+        if levels <= 0:
+            continue
 
-    for left, right in zip(lhs_shrinks, rhs_shrinks):
-        if not compare_shrinkable(left, right, max_elements - 1):
+        lhs_shrinks = left.shrinks().to_list()
+        rhs_shrinks = right.shrinks().to_list()
+        if len(lhs_shrinks) != len(rhs_shrinks):
             return False
 
+        stack.extend((a, b, levels - 1) for a, b in zip(lhs_shrinks, rhs_shrinks))
+
     return True
 
 
@@ -65,11 +80,20 @@ def exhaustive_traversal(shrinkable: Shrinkable, level: int = 0, func=None):
         exhaustive_traversal(shrink, level + 1, func)
 
 
+_LEAF: Dict[int, Shrinkable[int]] = {}
+
+
+def leaf(k: int) -> Shrinkable[int]:
+    """Return a shared shrinkable with value k and no shrinks."""
+    s = _LEAF.get(k)
+    if s is None:
+        s = _LEAF[k] = Shrinkable(k)
+    return s
+
+
 def gen_shrinkable_21() -> Shrinkable[int]:
     """Generate a shrinkable with value 2 and shrinks [0, 1]."""
-    return Shrinkable(2).with_shrinks(
-        lambda: Stream.many([Shrinkable(0), Shrinkable(1)])
-    )
+    return Shrinkable(2).with_shrinks(lambda: Stream.many([leaf(0), leaf(1)]))
 
 
 def gen_shrinkable_40213() -> Shrinkable[int]:
@@ -77,9 +101,9 @@ def gen_shrinkable_40213() -> Shrinkable[int]:
     return Shrinkable(4).with_shrinks(
         lambda: Stream.many(
             [
-                Shrinkable(0),
-                Shrinkable(2).with_shrinks(lambda: Stream.one(Shrinkable(1))),
-                Shrinkable(3),
+                leaf(0),
+                Shrinkable(2).with_shrinks(lambda: Stream.one(leaf(1))),
+                leaf(3),
             ]
         )
     )
@@ -132,6 +156,10 @@ def gen_shrinkable_964285173() -> Shrinkable[int]:
 class TestShrinkerComprehensive(unittest.TestCase):
     """Comprehensive shrinker tests ported from dartproptest."""
 
+    def assertShrinkableEqual(self, a: Shrinkable, b: Shrinkable) -> None:
+        """Assert that two shrinkables have structurally equal trees."""
+        self.assertTrue(compare_shrinkable(a, b), f"{a!r} != {b!r}")
+
     def test_basic_shrinkable(self):
         """Test basic shrinkable creation."""
         shr = Shrinkable(0)
@@ -300,9 +328,7 @@ class TestShrinkerComprehensive(unittest.TestCase):
         """Test retrieve method."""
         shr = gen_shrinkable_40213()
         assert shr.retrieve([]).value == 4
-        assert serialize_shrinkable(shr.retrieve([0])) == serialize_shrinkable(
-            Shrinkable(0)
-        )
+        self.assertShrinkableEqual(shr.retrieve([0]), Shrinkable(0))
         assert (
             serialize_shrinkable(shr.retrieve([1]))
             == '{"value":2,"shrinks":[{"value":1}]}'
@@ -349,9 +375,20 @@ class TestShrinkerComprehensive(unittest.TestCase):
         shr2 = gen_shrinkable_21()
         shr3 = Shrinkable(2).with_shrinks(lambda: Stream.one(Shrinkable(0)))
 
-        assert compare_shrinkable(shr1, shr2) is True
+        self.assertShrinkableEqual(shr1, shr2)
         assert compare_shrinkable(shr1, shr3) is False
 
+    def test_shrinkable_compare_wide_trees(self):
+        """Test that wide trees differing in their first child compare unequal."""
+        children = [leaf(k) for k in range(2000)]
+        wide1 = Shrinkable(0).with_shrinks(lambda: Stream.many(children))
+        wide2 = Shrinkable(0).with_shrinks(
+            lambda: Stream.many([leaf(-1)] + children[1:])
+        )
+
+        self.assertShrinkableEqual(wide1, wide1)
+        assert compare_shrinkable(wide1, wide2) is False
+
     def test_shrinkable_exhaustive_traversal(self):
         """Test exhaustive traversal."""
         shr = gen_shrinkable_40213()
@@ -397,13 +434,7 @@ class TestArrayLengthShrinking(unittest.TestCase):
         """Test that shrinkArrayLength shrinks array lengths."""
         from python_proptest.core.shrinker import shrink_array_length
 
-        elements = [
-            Shrinkable(1),
-            Shrinkable(2),
-            Shrinkable(3),
-            Shrinkable(4),
-            Shrinkable(5),
-        ]
+        elements = [leaf(1), leaf(2), leaf(3), leaf(4), leaf(5)]
 
         array_shrinkable = shrink_array_length(elements, 2)
         assert len(array_shrinkable.value) == 5
@@ -487,11 +518,7 @@ class TestShrinkableSet(unittest.TestCase):
         try:
             from python_proptest.core.shrinker import shrinkable_set
 
-            elements = [
-                Shrinkable(1),
-                Shrinkable(2),
-                Shrinkable(3),
-            ]
+            elements = [leaf(1), leaf(2), leaf(3)]
 
             set_shrinkable = shrinkable_set(elements, 1)
             assert set_shrinkable.value == {1, 2, 3}
@@ -510,11 +537,7 @@ class TestShrinkableTuple(unittest.TestCase):
         try:
             from python_proptest.core.shrinker import shrinkable_tuple
 
-            elements = [
-                Shrinkable(1),
-                Shrinkable(2),
-                Shrinkable(3),
-            ]
+            elements = [leaf(1), leaf(2), leaf(3)]
 
             tuple_shrinkable = shrinkable_tuple(elements)
             assert tuple_shrinkable.value == (1, 2, 3)
@@ -10,6 +10,33 @@ import unittest
 
 from python_proptest import Gen
 
+# Generators are stateless, so one instance of each shape is shared by all tests
+_GEN_TUP2_5_10 = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10))
+_GEN_TUP3_5_10 = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
+_GEN_TUP4_5_10 = Gen.tuple(
+    Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10)
+)
+_GEN_TUP3_7_9 = Gen.tuple(Gen.int(7, 9), Gen.int(7, 9), Gen.int(7, 9))
+
+# First seed for which Gen.tuple(Gen.int(5, 10) x 3) yields a root with every
+# element above 5, so that every position has room to shrink
+_ALL_POSITIONS_SHRINKABLE_SEED = 3
+
+
+def walk(shrinkable, max_depth):
+    """Yield (node, depth) for every node of the shrink tree up to max_depth."""
+    stack = [(shrinkable, 0)]
+    while stack:
+        sh, depth = stack.pop()
+        yield sh, depth
+        if depth < max_depth:
+            stack.extend((child, depth + 1) for child in sh.shrinks().to_list())
+
+
+def tree_values(shrinkable, max_depth):
+    """Return the values of every node of the shrink tree up to max_depth."""
+    return [sh.value for sh, _ in walk(shrinkable, max_depth)]
+
 
 def serialize_shrink_tree(shrinkable, max_depth=5):
     """
@@ -23,26 +50,16 @@ def serialize_shrink_tree(shrinkable, max_depth=5):
 
     Args:
         shrinkable: The Shrinkable to serialize
-        max_depth: Maximum depth to serialize
+        max_depth: Maximum depth to serialize; nodes at that depth have no shrinks
 
     Returns:
         A dictionary representing the shrink tree
     """
-
-    def serialize_recursive(sh, depth=0):
-        if depth > max_depth:
-            return None
-
-        result = {"value": sh.value, "shrinks": []}
-
-        for child in sh.shrinks().to_list():
-            child_serialized = serialize_recursive(child, depth + 1)
-            if child_serialized is not None:
-                result["shrinks"].append(child_serialized)
-
-        return result
-
-    return serialize_recursive(shrinkable)
+    children = shrinkable.shrinks().to_list() if max_depth > 0 else []
+    return {
+        "value": shrinkable.value,
+        "shrinks": [serialize_shrink_tree(child, max_depth - 1) for child in children],
+    }
 
 
 def shrink_tree_to_string(shrinkable, max_depth=5):
@@ -50,36 +67,47 @@ def shrink_tree_to_string(shrinkable, max_depth=5):
     Convert shrink tree to a canonical string representation.
 
     Format: "value[child1,child2,...]" where children are recursively formatted.
-    This provides a compact, deterministic representation.
+    Nodes at max_depth are formatted as their bare value. This provides a
+    compact, deterministic representation.
     """
+    value_str = str(shrinkable.value)
+    children = shrinkable.shrinks().to_list() if max_depth > 0 else []
+    if not children:
+        return value_str
 
-    def to_string_recursive(sh, depth=0):
-        if depth > max_depth:
-            return "..."
-
-        value_str = str(sh.value)
-        children = sh.shrinks().to_list()
-
-        if not children:
-            return value_str
-
-        # Sort children by value for deterministic output
-        children_strs = sorted(
-            [to_string_recursive(child, depth + 1) for child in children]
-        )
-        return f"{value_str}[{','.join(children_strs)}]"
-
-    return to_string_recursive(shrinkable)
+    # Sort children by value for deterministic output
+    children_strs = sorted(
+        shrink_tree_to_string(child, max_depth - 1) for child in children
+    )
+    return f"{value_str}[{','.join(children_strs)}]"
 
 
 class TestTupleShrinkTreeStructure(unittest.TestCase):
     """Test that tuple shrink trees have the expected structure."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Generation is deterministic for a fixed seed and the tests never
+        # mutate the shrinkables, so each one is generated once per class
+        cls._rng = random.Random()
+        cls.shrinkable_42_2 = cls._generate(_GEN_TUP2_5_10, 42)
+        cls.shrinkable_42_3 = cls._generate(_GEN_TUP3_5_10, 42)
+        cls.shrinkable_42_4 = cls._generate(_GEN_TUP4_5_10, 42)
+        cls.shrinkable_42_3_7_9 = cls._generate(_GEN_TUP3_7_9, 42)
+
+    @classmethod
+    def _generate(cls, gen, seed):
+        cls._rng.seed(seed)
+        return gen.generate(cls._rng)
+
+    def setUp(self):
+        # One generator state is reused by every test and reseeded here
+        self.rng = self._rng
+        self.rng.seed(42)
+
     def test_tuple_length_2_shrink_tree(self):
         """Test shrink tree structure for tuple of length 2."""
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10))
-        shrinkable = gen.generate(rng)
+        shrinkable = self.shrinkable_42_2
 
         # Serialize the tree
         tree_str = shrink_tree_to_string(shrinkable, max_depth=4)
@@ -94,142 +122,100 @@ class TestTupleShrinkTreeStructure(unittest.TestCase):
         self.assertIn("[", tree_str)  # Should have children
 
         # Verify all values respect constraints
-        def check_constraints(sh, depth=0, max_depth=5):
-            if depth > max_depth:
-                return []
-            problems = []
-            for val in sh.value:
-                if val < 5 or val > 10:
-                    problems.append((sh.value, val))
-            for child in sh.shrinks().to_list():
-                problems.extend(check_constraints(child, depth + 1, max_depth))
-            return problems
-
-        problems = check_constraints(shrinkable)
-        self.assertEqual(len(problems), 0, f"Constraint violations: {problems}")
+        out_of_range = [
+            value
+            for value in tree_values(shrinkable, 5)
+            if min(value) < 5 or max(value) > 10
+        ]
+        self.assertEqual(out_of_range, [], "Constraint violations")
 
     def test_tuple_length_3_shrink_tree_deterministic(self):
         """Test shrink tree structure for tuple of length 3 with fixed seed."""
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
-        shrinkable = gen.generate(rng)
+        shrinkable = self.shrinkable_42_3
 
-        # Serialize to JSON for comparison
-        tree_json = serialize_shrink_tree(shrinkable, max_depth=3)
+        values = tree_values(shrinkable, 3)
+
+        # The shared generator is a plain reusable object: a freshly built one
+        # is a different instance that produces the same tree
+        fresh_gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
+        self.assertIsNot(fresh_gen, _GEN_TUP3_5_10)
+        self.assertEqual(
+            serialize_shrink_tree(fresh_gen.generate(self.rng), max_depth=3),
+            serialize_shrink_tree(shrinkable, max_depth=3),
+        )
 
         # Verify structure
-        self.assertIn("value", tree_json)
-        self.assertIn("shrinks", tree_json)
-        self.assertEqual(tree_json["value"], shrinkable.value)
+        self.assertEqual(values[0], shrinkable.value)
 
         # Verify all shrinks are tuples of length 3
-        def verify_structure(node, depth=0, max_depth=3):
-            if depth > max_depth:
-                return
-            self.assertIsInstance(node["value"], tuple)
-            self.assertEqual(len(node["value"]), 3)
-            for child in node.get("shrinks", []):
-                verify_structure(child, depth + 1, max_depth)
-
-        verify_structure(tree_json)
+        for value in values:
+            self.assertIsInstance(value, tuple)
+            self.assertEqual(len(value), 3)
 
     def test_tuple_shrink_tree_uniqueness(self):
         """Test that all values in shrink tree are unique."""
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
-        shrinkable = gen.generate(rng)
+        shrinkable = self.shrinkable_42_3
+
+        # All values should be unique; stop at the first duplicate
+        seen = set()
+        duplicate = None
+        for sh, _ in walk(shrinkable, 5):
+            if sh.value in seen:
+                duplicate = sh.value
+                break
+            seen.add(sh.value)
 
-        all_values = []
+        self.assertIsNone(duplicate, f"Found duplicate value {duplicate}")
 
-        def collect_all(sh, depth=0, max_depth=5):
-            if depth > max_depth:
-                return
-            all_values.append(sh.value)
-            for child in sh.shrinks().to_list():
-                collect_all(child, depth + 1, max_depth)
+    def test_tuple_shrink_tree_all_positions_shrink(self):
+        """Test that all positions in the tuple can be shrunk."""
+        self.rng.seed(_ALL_POSITIONS_SHRINKABLE_SEED)
+        shrinkable = _GEN_TUP3_5_10.generate(self.rng)
+        root = shrinkable.value
 
-        collect_all(shrinkable)
+        # All elements must be above the minimum so each one can shrink
+        self.assertTrue(all(x > 5 for x in root), f"root={root}")
 
-        # All values should be unique
-        unique_values = set(all_values)
-        self.assertEqual(
-            len(all_values),
-            len(unique_values),
-            f"Found {len(all_values) - len(unique_values)} duplicate values",
-        )
+        # Collect all values
+        all_values = {sh.value for sh, _ in walk(shrinkable, 4)}
 
-    def test_tuple_shrink_tree_all_positions_shrink(self):
-        """Test that all positions in the tuple can be shrunk."""
-        # Find a seed that generates a tuple where all elements can shrink
-        for seed in range(100):
-            rng = random.Random(seed)
-            gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
-            shrinkable = gen.generate(rng)
-            root = shrinkable.value
-
-            # Check if all elements are above minimum (can shrink)
-            if all(x > 5 for x in root):
-                # Collect all values
-                all_values = set()
-
-                def collect_all(sh, depth=0, max_depth=4):
-                    if depth > max_depth:
-                        return
-                    all_values.add(sh.value)
-                    for child in sh.shrinks().to_list():
-                        collect_all(child, depth + 1, max_depth)
-
-                collect_all(shrinkable)
-
-                # Check that each position has been shrunk
-                position_shrunk = {0: False, 1: False, 2: False}
-                for tup in all_values:
-                    if tup == root:
-                        continue
-                    for i in range(3):
-                        if tup[i] != root[i]:
-                            position_shrunk[i] = True
-                            break
-
-                # All positions should be shrinkable
-                self.assertTrue(
-                    all(position_shrunk.values()),
-                    f"Not all positions were shrunk: {position_shrunk}, root={root}",
-                )
-                break
+        # Check that each position has been shrunk
+        position_shrunk = {0: False, 1: False, 2: False}
+        for tup in all_values:
+            if tup == root:
+                continue
+            for i in range(3):
+                if tup[i] != root[i]:
+                    position_shrunk[i] = True
+                    break
+
+        # All positions should be shrinkable
+        self.assertTrue(
+            all(position_shrunk.values()),
+            f"Not all positions were shrunk: {position_shrunk}, root={root}",
+        )
 
     def test_tuple_shrink_tree_recursive_structure(self):
         """Test that shrink tree has recursive structure (shrinks of shrinks)."""
-        rng = random.Random(3)
-        gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
-        shrinkable = gen.generate(rng)
+        self.rng.seed(3)
+        shrinkable = _GEN_TUP3_5_10.generate(self.rng)
 
         # Check for recursive shrinking (shrinks should have their own shrinks)
-        has_recursive = False
-
-        def check_recursive(sh, depth=0, max_depth=3):
-            nonlocal has_recursive
-            if depth > max_depth:
-                return
-            for child in sh.shrinks().to_list():
-                if not child.shrinks().is_empty():
-                    has_recursive = True
-                    return
-                check_recursive(child, depth + 1, max_depth)
-
-        check_recursive(shrinkable)
+        has_recursive = any(
+            not sh.shrinks().is_empty()
+            for sh, depth in walk(shrinkable, 4)
+            if depth > 0
+        )
         self.assertTrue(has_recursive, "Shrink tree should have recursive structure")
 
     def test_tuple_shrink_tree_serialization_consistency(self):
         """Test that serialization is consistent across multiple calls."""
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
-        shrinkable = gen.generate(rng)
+        shrinkable = self.shrinkable_42_3
 
         # Serialize multiple times
-        tree1 = serialize_shrink_tree(shrinkable, max_depth=3)
-        tree2 = serialize_shrink_tree(shrinkable, max_depth=3)
-        tree3 = serialize_shrink_tree(shrinkable, max_depth=3)
+        tree1, tree2, tree3 = [
+            serialize_shrink_tree(shrinkable, max_depth=3) for _ in range(3)
+        ]
 
         # Should be identical
         self.assertEqual(tree1, tree2)
@@ -242,9 +228,7 @@ class TestTupleShrinkTreeStructure(unittest.TestCase):
 
     def test_tuple_shrink_tree_expected_structure(self):
         """Test against a known expected structure for a specific seed."""
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
-        shrinkable = gen.generate(rng)
+        shrinkable = self.shrinkable_42_3
 
         root = shrinkable.value
 
@@ -263,55 +247,32 @@ class TestTupleShrinkTreeStructure(unittest.TestCase):
 
     def test_tuple_length_4_shrink_tree(self):
         """Test shrink tree structure for tuple of length 4."""
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
-        shrinkable = gen.generate(rng)
+        shrinkable = self.shrinkable_42_4
 
-        # Serialize the tree
-        tree_json = serialize_shrink_tree(shrinkable, max_depth=2)
+        values = tree_values(shrinkable, 2)
 
         # Verify structure
-        self.assertIn("value", tree_json)
-        self.assertIn("shrinks", tree_json)
-        self.assertEqual(len(tree_json["value"]), 4)
+        self.assertEqual(values[0], shrinkable.value)
 
         # Verify all shrinks are tuples of length 4
-        def verify_structure(node, depth=0, max_depth=2):
-            if depth > max_depth:
-                return
-            self.assertIsInstance(node["value"], tuple)
-            self.assertEqual(len(node["value"]), 4)
-            for child in node.get("shrinks", []):
-                verify_structure(child, depth + 1, max_depth)
-
-        verify_structure(tree_json)
+        for value in values:
+            self.assertIsInstance(value, tuple)
+            self.assertEqual(len(value), 4)
 
     def test_tuple_shrink_tree_with_constraints(self):
         """Test shrink tree structure with constrained generators."""
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(7, 9), Gen.int(7, 9), Gen.int(7, 9))
-        shrinkable = gen.generate(rng)
+        shrinkable = self.shrinkable_42_3_7_9
 
         # Serialize the tree (verify function works)
         shrink_tree_to_string(shrinkable, max_depth=3)
 
-        # Verify all values in tree respect constraints
-        all_values = set()
-
-        def collect_all(sh, depth=0, max_depth=4):
-            if depth > max_depth:
-                return
-            all_values.add(sh.value)
-            for child in sh.shrinks().to_list():
-                collect_all(child, depth + 1, max_depth)
-
-        collect_all(shrinkable)
-
-        # All values should be within [7, 9] for each element
-        for tup in all_values:
-            for val in tup:
-                self.assertGreaterEqual(val, 7, f"Value {val} < 7 in tuple {tup}")
-                self.assertLessEqual(val, 9, f"Value {val} > 9 in tuple {tup}")
+        # All values in the tree should be within [7, 9] for each element
+        out_of_range = [
+            value
+            for value in tree_values(shrinkable, 4)
+            if min(value) < 7 or max(value) > 9
+        ]
+        self.assertEqual(out_of_range, [], "Values out of [7, 9]")
 
     def test_tuple_shrink_tree_expected_serialization(self):
         """Test that shrink tree matches expected serialized representation.
@@ -319,9 +280,7 @@ class TestTupleShrinkTreeStructure(unittest.TestCase):
         This is a regression test to ensure the internal structure doesn't change.
         The expected tree is generated with seed=42, Gen.tuple(Gen.int(5,10), ...).
         """
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
-        shrinkable = gen.generate(rng)
+        shrinkable = self.shrinkable_42_3
 
         # Serialize the tree
         tree_json = serialize_shrink_tree(shrinkable, max_depth=3)
@@ -368,9 +327,7 @@ class TestTupleShrinkTreeStructure(unittest.TestCase):
         shrink tree structure has changed. Update the expected JSON if the change
         is intentional.
         """
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
-        shrinkable = gen.generate(rng)
+        shrinkable = self.shrinkable_42_3
 
         # Serialize the tree
         actual_tree = serialize_shrink_tree(shrinkable, max_depth=3)
@@ -387,51 +344,17 @@ class TestTupleShrinkTreeStructure(unittest.TestCase):
             ],
         }
 
-        # Compare structures
-        self.assertEqual(
-            actual_tree["value"], expected_tree["value"], "Root value mismatch"
-        )
-        self.assertEqual(
-            len(actual_tree["shrinks"]),
-            len(expected_tree["shrinks"]),
-            "Number of direct shrinks mismatch",
-        )
-
-        # Compare each shrink
-        for i, (actual_shrink, expected_shrink) in enumerate(
-            zip(actual_tree["shrinks"], expected_tree["shrinks"])
-        ):
-            self.assertEqual(
-                actual_shrink["value"],
-                expected_shrink["value"],
-                f"Shrink {i} value mismatch: {actual_shrink['value']} != {expected_shrink['value']}",
-            )
-            self.assertEqual(
-                len(actual_shrink["shrinks"]),
-                len(expected_shrink["shrinks"]),
-                f"Shrink {i} number of child shrinks mismatch",
-            )
-
-            # Compare child shrinks if any
-            for j, (actual_child, expected_child) in enumerate(
-                zip(actual_shrink["shrinks"], expected_shrink["shrinks"])
-            ):
-                self.assertEqual(
-                    actual_child["value"],
-                    expected_child["value"],
-                    f"Shrink {i} child {j} value mismatch",
-                )
+        # Compare both trees in a single assertion
+        self.assertEqual(actual_tree, expected_tree)
 
     def test_tuple_shrink_tree_string_representation(self):
         """Test that string representation is consistent and deterministic."""
-        rng = random.Random(42)
-        gen = Gen.tuple(Gen.int(5, 10), Gen.int(5, 10), Gen.int(5, 10))
-        shrinkable = gen.generate(rng)
+        shrinkable = self.shrinkable_42_3
 
         # Generate string representation multiple times
-        str1 = shrink_tree_to_string(shrinkable, max_depth=3)
-        str2 = shrink_tree_to_string(shrinkable, max_depth=3)
-        str3 = shrink_tree_to_string(shrinkable, max_depth=3)
+        str1, str2, str3 = [
+            shrink_tree_to_string(shrinkable, max_depth=3) for _ in range(3)
+        ]
 
         # Should be identical
         self.assertEqual(str1, str2)